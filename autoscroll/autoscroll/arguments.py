@@ -1,5 +1,6 @@
-from argparse import SUPPRESS, HelpFormatter, ArgumentParser, _ArgumentGroup
+from argparse import SUPPRESS, ArgumentError, HelpFormatter, ArgumentParser, _ArgumentGroup
 from typing import Any, Dict, List
+from .functions import get_resource_content
 
 
 def parse_arguments(**arguments: Any) -> Dict[str, Any]:
@@ -65,6 +66,27 @@ class _ArgparseArgumentGroup(_ArgumentGroup):
 
 class ArgparseParser(ArgumentParser):
 
+    # the description is read from package resources only when the help
+    # message is formatted, not on every startup
+    def __init__(self, *args, description_resource: str = None,
+                 **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.description_resource = description_resource
+
+    # override
+    def format_help(self) -> str:
+        if self.description is None and self.description_resource:
+            self.description = get_resource_content(self.description_resource)
+        return super().format_help()
+
+    # override
+    # with exit_on_error set to False, every error is raised instead of
+    # printed, not only invalid values
+    def error(self, message: str):
+        if self.exit_on_error:
+            return super().error(message)
+        raise ArgumentError(None, message)
+
     # override
     def add_argument_group(self, *args,
                            parameters: Dict[str, Dict[str, Any]] = None,
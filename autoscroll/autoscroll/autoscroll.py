@@ -1,118 +1,342 @@
-from .support import Base, Config, Scrolling, Icon, Buttons, Debug
-from typing import Any, Dict
-from pynput.mouse import Button, Listener
-from threading import Event, Thread
-from time import sleep
+from .backends import Source
+from .constants import CONFIG_ERROR_APPLY
+from .functions import convert_json
+from .support import (Base, Config, Scrolling, Icon, Buttons, Debug, Metrics,
+                      Remote, Listener, Profiles)
+from .tracer import BUTTON_INDEXES, CLICK, MOVE, TICK
+from typing import Any, Callable, Dict, List
+from argparse import ArgumentError
+from asyncio import AbstractEventLoop, Task, gather, new_event_loop
+from asyncio import Event as AsyncioEvent
+from json import dumps
+from pynput.mouse import Button
+from signal import SIGINT, SIGTERM, signal
+from threading import Event, Lock, Thread, current_thread, main_thread
+from time import monotonic_ns
 
 
 class Autoscroll(Base):
 
-    def __init__(self, *args, **kwargs) -> None:
+    # source - where mouse events come from, anything that follows
+    # backends.Source, overrides the listener backend
+    def __init__(self, *args, source: Callable[..., Source] = None,
+                 **kwargs) -> None:
         self.scrolling: Scrolling = Scrolling()
         self.icon: Icon = Icon()
         self.config: Config = Config()
         self.buttons: Buttons = Buttons()
         self.debug: Debug = Debug()
+        self.metrics: Metrics = Metrics()
+        self.remote: Remote = Remote()
+        self.listener: Listener = Listener()
+        self.profiles: Profiles = Profiles()
         self.event_end: Event = Event()
+        self.lock_update: Lock = Lock()
+        # scrolling, the config file, the metrics and the control socket
+        # are coroutines on it, see _run
+        self.loop: AbstractEventLoop = new_event_loop()
+        # created on the loop, set by stop and every update
+        self.event_stop: AsyncioEvent = None
+        self.event_updated: AsyncioEvent = None
+        self.tracer = self.debug.tracer
+        self.collector = self.metrics.collector
+        # the icon shows the direction of the scrolling
+        self.icon.get_direction = self.scrolling.get_direction
+        self.listener.on_move = self._on_move
+        self.listener.on_click = self._on_click
+        self.listener.factory = source
+        self.listener.latency = self.collector.input_latency
 
         # update from initializer arguments
         self.update(*args, **kwargs)
 
         # threads
-        # mouse actions
-        self.thread_scroll_listener = Listener(on_move=self._on_move,
-                                               on_click=self._on_click,
-                                               daemon=True)
-        # scroll
-        self.thread_scroll_action = Thread(target=self._loop, daemon=True,
-                                           args=(self._is_not_end,
-                                                 self._scroll))
-        # update from the config file (if enabled)
-        self.thread_config = Thread(target=self._loop, daemon=True,
-                                    args=(self._is_not_end,
-                                          self._update_from_config_file))
+        # mouse actions, pointer motion only reaches _on_move while
+        # scrolling, replaced when the listener backend changes
+        self.listener.create()
+        # everything else
+        self.thread_loop = Thread(target=self._run_loop, daemon=True)
 
     def start(self, parse_argv: bool = False) -> None:
-        # update from the command line
-        # it is a thread because in order to create a qt icon widget,
-        # a qt application has to be running in the main thread.
-        # so, if the icon is enabled, the thread will have to wait untill the
-        # qt application is running in the main thread
-        Thread(target=self.update, kwargs=(self.config.parse_argv()
-                                           if parse_argv else {})).start()
+        # update from the command line, before anything runs
+        self.update(**(self.config.parse_argv() if parse_argv else {}))
+        # stop on ctrl+c and kill
+        if current_thread() is main_thread():
+            for signal_number in (SIGINT, SIGTERM):
+                signal(signal_number, lambda *_: self.stop())
         # start listening for mouse movements and clicks
         self.thread_scroll_listener.start()
-        # start the scrolling loop
-        self.thread_scroll_action.start()
-        # update from the command line
-        # start listening for changes in the config file
-        self.thread_config.start()
+        # start scrolling, watching the config file, writing the metrics and
+        # listening on the control socket, whichever is enabled
+        self.thread_loop.start()
         # debug
         self._print('initial', self.debug.initial)
-        # wait untill the icon is enabled, then run a qt application
+        # wait untill the icon is enabled, then run a qt application, it
+        # returns on stop
         self.icon.start_qt_when_icon_is_enabled()
+        self.thread_loop.join()
 
-    def _update_from_config_file(self) -> None:
-        # wait untill the config file is enabled
-        self.config.wait()
-        # update from the config file
-        self.update(**self.config.parse_config_file())
-        # debug
-        self.config._print('config', self.debug.file, ['content'])
-        # sleep
-        sleep(self.config.interval)
-
-    def _scroll(self) -> None:
-        # wait for the scrolling event to be set in _on_click
-        self.scrolling.wait()
-        # wait for a period of time, calculated in _on_move
-        self.scrolling.sleep_for_interval()
-        # scroll on x-axis and y-axis, each scroll is either 1px, 0px, or -1px
-        self.scrolling.scroll_once()
+    def stop(self) -> None:
+        # from any thread, or a signal handler, start returns once the loop
+        # has finished
+        self.event_end.set()
+        self._call_soon(self._stop)
+        self.icon.quit()
+
+    def _stop(self) -> None: self.event_stop.set()
+
+    def _run_loop(self) -> None:
+        try:
+            self.loop.run_until_complete(self._run())
+        finally:
+            self.loop.close()
+
+    async def _run(self) -> None:
+        self.event_stop, self.event_updated = AsyncioEvent(), AsyncioEvent()
+        if self.event_end.is_set():
+            return
+        tasks: List[Task] = [self.loop.create_task(coroutine)
+                             for coroutine in (self._scroll(),
+                                               self._update_from_config_file(),
+                                               self._write_metrics(),
+                                               self._serve_remote())]
+        for task in tasks:
+            task.add_done_callback(self._report)
+        await self.event_stop.wait()
+        # nothing runs after this, in this order
+        self.thread_scroll_listener.stop()
+        self.profiles.close()
+        for task in tasks:
+            task.cancel()
+        await gather(*tasks, return_exceptions=True)
+        self.remote.close()
+        self.metrics.write()
+        self.scrolling.close()
+        self.debug.recorder.close()
+
+    def _report(self, task: Task) -> None:
+        # an exception that ended a coroutine is printed, the rest keeps
+        # running
+        if not task.cancelled() and task.exception() is not None:
+            self.loop.call_exception_handler({
+                'message': f'{task.get_coro().__qualname__} has stopped',
+                'exception': task.exception(), 'task': task})
+
+    def _call_soon(self, callback: Callable) -> None:
+        # in the loop, from any thread, nothing happens if it is not running
+        if not self.loop.is_running():
+            return
+        try:
+            self.loop.call_soon_threadsafe(callback)
+        except RuntimeError:
+            # closed in the meantime
+            pass
+
+    def _wake_waiting(self) -> None:
+        # coroutines waiting for an option to change check it again
+        self.event_updated.set()
+        self.event_updated.clear()
+
+    async def _update_from_config_file(self) -> None:
+        while True:
+            # wait untill the config file is enabled
+            if not self.config.enable:
+                await self.event_updated.wait()
+                continue
+            # update from the config file, only what has changed
+            start = monotonic_ns()
+            try:
+                self.config.apply_config_file(self.update)
+            except (ArgumentError, TypeError, ValueError, OSError,
+                    SystemExit) as exception:
+                # printed, the file is watched for the next change
+                self.loop.call_exception_handler({
+                    'message': f'{CONFIG_ERROR_APPLY}, '
+                               f'path - {self.config.path}',
+                    'exception': exception})
+            self.collector.config_reload.record(monotonic_ns() - start)
+            self.collector.config_reloads += 1
+            # debug
+            self.config._print('config', self.debug.file, ['content'])
+            # wait for the file to change
+            await self.config.wait_for_change()
+
+    async def _write_metrics(self) -> None:
+        while True:
+            # wait untill the metrics are enabled
+            if not self.metrics.enable:
+                await self.event_updated.wait()
+                continue
+            self.metrics.write()
+            await self.metrics.wait_for_interval()
+
+    async def _serve_remote(self) -> None:
+        while True:
+            # wait untill the control socket is enabled, then serve it
+            # untill it is disabled or its path changes
+            if not self.remote.enable:
+                await self.event_updated.wait()
+                continue
+            try:
+                await self.remote.serve(self._on_remote)
+            except ValueError as exception:
+                # disabled, an update can enable it again
+                self.loop.call_exception_handler({
+                    'message': 'the control socket has stopped',
+                    'exception': exception})
+
+    def _on_remote(self, line: str) -> str:
+        # a command, or options just like on the command line, applied at
+        # once
+        command = line.strip()
+        if command == 'status':
+            return dumps(convert_json(self.json())) + '\n'
+        if command == 'metrics':
+            return self.metrics.collector.prometheus()
+        if command in ('help', '-h', '--help'):
+            return self.config.argument_parser.format_help()
+        try:
+            self.update(**self.config.parse_string(command,
+                                                   exit_on_error=False))
+        except (ArgumentError, TypeError, ValueError) as exception:
+            return f'error: {exception}\n'
+        except SystemExit:
+            return 'error: --help is only available on the command line\n'
+        return 'ok\n'
+
+    async def _scroll(self) -> None:
+        while True:
+            # wait for the scrolling to be started in _on_click and for the
+            # pointer to leave the dead area, in lazy mode the latest
+            # position from _on_move is applied while waiting
+            await self.scrolling.wait()
+            # wait for the next deadline, the interval is calculated in
+            # _on_move, start, stop, direction and interval changes wake it
+            # up at once
+            await self.scrolling.sleep_for_interval()
+            # scroll on x-axis and y-axis, each tick is either 1px, 0px, or
+            # -1px, missed ticks are scrolled at once, nothing is scrolled if
+            # the scrolling has stopped in the meantime
+            self.scrolling.scroll_once()
+            # metrics
+            if self.scrolling.ticks:
+                self._collect_scroll()
+            # debug
+            if self.tracer.scroll and self.scrolling.ticks:
+                motion = self.scrolling.motion
+                self.tracer.record(TICK, self.scrolling.ticks,
+                                   motion.direction_x, motion.direction_y,
+                                   int(self.scrolling.tick * 1e6))
+
+    def _collect_scroll(self) -> None:
+        collector, scheduler = self.collector, self.scrolling.scheduler
+        collector.scrolls += 1
+        collector.ticks_missed += self.scrolling.ticks - 1
+        collector.tick_lateness.record(scheduler.late)
+        if collector.scroll_started:
+            collector.scroll_start.record(monotonic_ns()
+                                          - collector.scroll_started)
+            collector.scroll_started = 0
 
     def _on_move(self, x: int, y: int) -> None:
-        # update coordinates
-        self.scrolling.set_direction_and_coordinates(x, y)
-        # recalculate sleep interval
-        self.scrolling.set_interval()
+        self.collector.motion_events += 1
+        # debug
+        if self.tracer.scroll:
+            self.tracer.record(MOVE, x, y)
+        # lazy mode: only store the latest position, it is applied once per
+        # tick in _scroll
+        if self.scrolling.lazy:
+            self.scrolling.position = x, y
+            return
+        # update coordinates, direction and sleep interval
+        self.scrolling.move(x, y)
 
     def _on_click(self, x: int, y: int, button: Button, pressed: bool) -> None:
+        start = monotonic_ns()
         # send information about which button was pressed/released
         self.buttons.press(button, pressed)
 
         if (not self.scrolling.is_scrolling()
                 and self.buttons.was_start_pressed()):
+            # the window under the pointer is already known, its profile
+            # curve already built
+            self.scrolling.use_profile(self.profiles.get_classes())
             self.scrolling.set_initial_coordinates(x, y)
             self.icon.show(x, y)
+            self.collector.scroll_started = start
             self.scrolling.start()
+            self.listener.attach()
         elif (self.buttons.was_end_pressed()
               or self.buttons.was_start_released_with_hold()):
+            self.listener.detach()
             self.scrolling.stop()
             self.icon.hide()
+            self.scrolling.scheduler._print('jitter', self.debug.jitter)
 
         # it should be placed at the end to avoid initial scroll jumps
-        self.scrolling.set_direction_and_coordinates(x, y)
+        self.scrolling.set_position(x, y)
         # debug
-        self._print('click', self.debug.click)
+        if self.tracer.click:
+            self.tracer.record(CLICK, x, y, BUTTON_INDEXES.get(button, 0),
+                               pressed, self.scrolling.is_scrolling())
         # start and end event have ended
         self.scrolling.clear_started_and_ended()
         # clear press information
         self.buttons.press_clear()
+        # metrics
+        self.collector.clicks += 1
+        self.collector.click.record(monotonic_ns() - start)
+
+    @property
+    def thread_scroll_listener(self) -> Source: return self.listener.source
 
     def update(self,
                scrolling: Dict[str, Any] = None,
                icon: Dict[str, Any] = None,
                buttons: Dict[str, Any] = None,
                debug: Dict[str, Any] = None,
-               config: Dict[str, Any] = None) -> None:
-        self.config.update(**self._convert(config, {}, dict))
-        self.scrolling.update(**self._convert(scrolling, {}, dict))
-        self.icon.update(**self._convert(icon, {}, dict))
-        self.buttons.update(**self._convert(buttons, {}, dict))
-        self.debug.update(**self._convert(debug, {}, dict))
-
-    def _is_not_end(self) -> bool: return not self.event_end.is_set()
+               config: Dict[str, Any] = None,
+               metrics: Dict[str, Any] = None,
+               remote: Dict[str, Any] = None,
+               listener: Dict[str, Any] = None,
+               profiles: Dict[str, Any] = None) -> None:
+        # groups without arguments are skipped, the updates from argv and
+        # the config file are applied one at a time, if any of the groups
+        # rejects its arguments the ones already updated are restored
+        with self.lock_update:
+            updated = []
+            try:
+                for group, arguments in ((self.config, config),
+                                         (self.scrolling, scrolling),
+                                         (self.icon, icon),
+                                         (self.buttons, buttons),
+                                         (self.debug, debug),
+                                         (self.metrics, metrics),
+                                         (self.remote, remote),
+                                         (self.listener, listener),
+                                         (self.profiles, profiles)):
+                    arguments = self._convert(arguments, {}, dict)
+                    if arguments:
+                        updated.append((group, group._get_arguments()))
+                        group.update(**arguments)
+                # the curves of the profiles are built here, not when the
+                # scrolling starts
+                if profiles:
+                    self.scrolling.set_profiles(self.profiles.get_options())
+            except Exception:
+                for group, arguments in reversed(updated):
+                    group.update(**arguments)
+                raise
+            # apply_config_file keeps the content once this returns
+            self.config.forget_config_file()
+            # recording is started and stopped on the listener callbacks
+            if debug:
+                self.listener.record(self.debug.recorder
+                                     if self.debug.record else None)
+        self._call_soon(self._wake_waiting)
 
     def json(self) -> Dict[str, Any]:
         return {'scrolling': self.scrolling, 'buttons': self.buttons,
-                'icon': self.icon, 'debug': self.debug, 'config': self.config}
+                'icon': self.icon, 'debug': self.debug, 'config': self.config,
+                'metrics': self.metrics, 'remote': self.remote,
+                'listener': self.listener, 'profiles': self.profiles}
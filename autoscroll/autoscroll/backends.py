@@ -0,0 +1,113 @@
+from abc import ABC, abstractmethod
+from threading import Event, Thread
+from time import monotonic_ns, sleep
+from typing import Callable, Iterable, List, Tuple, Union
+from pynput.mouse import Button
+from .functions import return_none
+
+
+class Sink(ABC):
+    """
+    where scroll events go
+
+    pynput's Controller and uinput's Controller follow the same interface,
+    pynput's without being a subclass
+    """
+
+    # takes fractions of a unit
+    fractional: bool = False
+
+    @abstractmethod
+    def scroll(self, dx: Union[int, float], dy: Union[int, float]) -> None:
+        pass
+
+    def close(self) -> None: return
+
+
+class Source(ABC):
+    """
+    where mouse events come from, a thread calling on_move(x, y) and
+    on_click(x, y, button, pressed)
+
+    pynput's Listener follows the same interface without being a subclass,
+    on_move and on_click are looked up on every event, so they can be
+    replaced while it is running
+    """
+
+    def __init__(self, on_move: Callable = None, on_click: Callable = None,
+                 daemon: bool = True) -> None:
+        self.on_move = on_move or return_none
+        self.on_click = on_click or return_none
+        self.event_stop: Event = Event()
+        self.thread: Thread = Thread(target=self.run, daemon=daemon)
+
+    @abstractmethod
+    def run(self) -> None: pass
+
+    def start(self) -> None: self.thread.start()
+
+    def stop(self) -> None: self.event_stop.set()
+
+    def join(self, timeout: float = None) -> None: self.thread.join(timeout)
+
+    def is_alive(self) -> bool: return self.thread.is_alive()
+
+
+class RecordingSink(Sink):
+    """
+    keeps scroll events in memory instead of sending them, for benchmarks
+    and for running without a display
+    """
+
+    def __init__(self, fractional: bool = False) -> None:
+        self.fractional = fractional
+        # monotonic time in nanoseconds, dx, dy
+        self.events: List[Tuple[int, Union[int, float], Union[int, float]]] = []
+
+    def scroll(self, dx: Union[int, float], dy: Union[int, float]) -> None:
+        self.events.append((monotonic_ns(), dx, dy))
+
+    def clear(self) -> None: self.events.clear()
+
+    def total(self) -> Tuple[Union[int, float], Union[int, float]]:
+        return (sum(event[1] for event in self.events),
+                sum(event[2] for event in self.events))
+
+
+class ReplaySource(Source):
+    """
+    replays mouse events instead of listening for them
+
+    every event is (time_ns, x, y) for a move or
+    (time_ns, x, y, button, pressed) for a click, with speed set to 0 the
+    events are replayed as fast as possible, otherwise the recorded delays
+    are divided by speed
+    """
+
+    def __init__(self, on_move: Callable = None, on_click: Callable = None,
+                 daemon: bool = True, events: Iterable[Tuple] = (),
+                 speed: float = 0) -> None:
+        super().__init__(on_move, on_click, daemon)
+        self.events = events
+        self.speed = speed
+        self.count: int = 0
+
+    def run(self) -> None:
+        start, first = monotonic_ns(), None
+        for event in self.events:
+            if self.event_stop.is_set():
+                break
+            if self.speed:
+                first = event[0] if first is None else first
+                delay = (event[0] - first) / self.speed \
+                    - (monotonic_ns() - start)
+                if delay > 0:
+                    sleep(delay / 1e9)
+            if len(event) == 3:
+                self.on_move(event[1], event[2])
+            else:
+                button = event[3]
+                if not isinstance(button, Button):
+                    button = Button(button)
+                self.on_click(event[1], event[2], button, event[4])
+            self.count += 1
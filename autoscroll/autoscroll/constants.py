@@ -1,19 +1,81 @@
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 from os import environ as os_environ
-from .functions import get_resource_content
 from .arguments import ArgparseFormatter
 
 SCROLLING_SPEED: int = 300
 SCROLLING_ACCELERATION_DISTANCE: int = 10
 SCROLLING_SLEEP_INTERVAL_INITIAL: float = 0.1
 SCROLLING_DEAD_AREA: int = 50
+SCROLLING_TICK_RATE: int = 0
+# how the speed grows with the distance from the starting point
+SCROLLING_FUNCTION: str = 'linear'
+SCROLLING_FUNCTIONS: Tuple[str, ...] = ('linear', 'quadratic', 'exponential',
+                                        'piecewise')
+SCROLLING_POINTS: str = ''
+SCROLLING_ERROR_POINTS: str = ('points should be \'distance:speed\' pairs '
+                               'separated by commas, with unique distances')
+SCROLLING_EUCLIDEAN: bool = False
+SCROLLING_INDEPENDENT: bool = False
+# quadratic and exponential curves match linear at about that distance
+SCROLLING_CURVE_SCALE: int = 100
+# distances the sleep interval is precomputed for, in pixels
+SCROLLING_TABLE_SIZE: int = 4096
+# steep curves are capped at that sleep interval, in seconds
+SCROLLING_INTERVAL_MINIMUM: float = 0.0005
+SCROLLING_LAZY: bool = False
+SCROLLING_BACKEND: str = 'pynput'
+SCROLLING_BACKENDS: Tuple[str, ...] = ('pynput', 'uinput', 'recording')
+SCROLLING_UINPUT_PATH: str = '/dev/uinput'
+SCROLLING_UINPUT_NAME: str = 'autoscroll virtual mouse'
+SCROLLING_ERROR_BACKEND: str = ('the scrolling backend could not be started, '
+                                'the uinput backend needs write access to '
+                                f'{SCROLLING_UINPUT_PATH} (linux only)')
+# missed ticks are scrolled at once, but no more than that many,
+# anything older is dropped
+SCROLLING_CATCH_UP: int = 10
+# the scroll loop is woken up if the interval gets smaller than
+# that part of the interval it is sleeping for
+SCROLLING_WAKE_RATIO: float = 0.75
 
 BUTTONS_START: int = 2
 BUTTONS_HOLD: bool = False
 
+LISTENER_BACKEND: str = 'pynput'
+LISTENER_BACKENDS: Tuple[str, ...] = ('pynput', 'evdev')
+# every pointer device if empty
+LISTENER_DEVICE: str = ''
+LISTENER_DEVICES: str = '/dev/input/event*'
+# input events read at once from a device
+LISTENER_EVENTS_MAX: int = 64
+LISTENER_ERROR_BACKEND: str = ('the listener backend could not be started, '
+                               'the evdev backend needs read access to '
+                               f'{LISTENER_DEVICES} (linux only, usually the '
+                               '\'input\' group) and a pointer device')
+
+PROFILES_ENABLE: bool = False
+PROFILES_WINDOW: Tuple[Tuple[str, ...], ...] = ()
+# scrolling options a profile can change, the curve and the dead area
+PROFILES_OPTIONS: Tuple[str, ...] = ('speed', 'acceleration', 'dead-area',
+                                     'function', 'points', 'euclidean',
+                                     'independent')
+# levels of windows searched for a class below a top-level window, window
+# managers put applications in frames
+PROFILES_WINDOW_DEPTH: int = 3
+PROFILES_ERROR_ENABLE: str = ('profiles are enabled, but the window under '
+                              'the pointer cannot be tracked, it needs an x '
+                              'server and the \'python-xlib\' package')
+PROFILES_ERROR_WINDOW: str = ('a profile should be a window class followed '
+                              'by option=value pairs, options are one of '
+                              f'{PROFILES_OPTIONS}, e.g. firefox speed=600 '
+                              'euclidean')
+
 ICON_ENABLE: bool = False
 ICON_SIZE: int = 30
 ICON_PATH: str = 'resources/img/icon.svg'
+# number of rasterized icons (path, size, device pixel ratio) kept around
+ICON_CACHE_SIZE: int = 16
+# color of the arrow pointing in the direction of the scrolling
+ICON_ARROW_COLOR: str = '#1e88e5'
 ICON_ERROR: str = ('icon is enabled (it is disabled by default), but the '
                    '\'pyside6\' package is not installed. '
                    'remove \'--icon-enable\' or install the package\n'
@@ -22,23 +84,54 @@ ICON_ERROR: str = ('icon is enabled (it is disabled by default), but the '
 CONFIG_PATH: str = f'{os_environ.get("HOME")}/.config/autoscroll/config.txt'
 CONFIG_ENABLE: bool = False
 CONFIG_INTERVAL: int = 5
+# bursts of writes to the config file closer than that are parsed once
+CONFIG_DEBOUNCE: float = 0.05
 CONFIG_ERROR_ENABLE: str = 'you are trying to enable the config (\'enable\' is set to \'True\'), but the path is not valid'
 CONFIG_ERROR_PARSE: str = 'you are trying to parse the config file, but \'enable\' is \'False\''
+CONFIG_ERROR_APPLY: str = 'the config file could not be applied'
+
+
+METRICS_ENABLE: bool = False
+METRICS_PATH: str = (f'{os_environ.get("XDG_RUNTIME_DIR", "/tmp")}'
+                     '/autoscroll/metrics.prom')
+METRICS_INTERVAL: int = 15
+METRICS_ERROR_INTERVAL: str = 'the metrics interval should be positive'
+
+
+REMOTE_ENABLE: bool = False
+REMOTE_PATH: str = (f'{os_environ.get("XDG_RUNTIME_DIR", "/tmp")}'
+                    '/autoscroll/control.sock')
+# longest line a client can send, and how long a reply can take to send,
+# in seconds
+REMOTE_LINE_MAX: int = 65536
+REMOTE_TIMEOUT: float = 1
+REMOTE_ERROR_ENABLE: str = 'the control socket could not be created'
 
 
 DEBUG_SCROLL: bool = False
 DEBUG_CLICK: bool = False
 DEBUG_INITIAL: bool = False
 DEBUG_FILE: bool = False
+DEBUG_JITTER: bool = False
+# where traced clicks and scrolling go, stdout if empty
+DEBUG_TRACE: str = ''
+# events kept in memory, and how often they are written, in seconds
+DEBUG_TRACE_SIZE: int = 16384
+DEBUG_TRACE_INTERVAL: float = 0.1
+# where input events are recorded, nothing is recorded if empty
+DEBUG_RECORD: str = ''
+# records kept in memory before they are written, and the size the file is
+# rotated at, in bytes, the previous one is kept with a '.1' suffix
+DEBUG_RECORD_BUFFER: int = 1024
+DEBUG_RECORD_SIZE: int = 64 * 2**20
+DEBUG_ERROR_RECORD: str = 'the input recording cannot be written'
 DEBUG_PADDING: int = 16
 
-COORDINATE_NAME: str = 'coordinates'
-
 
 PARSER_INITIALIZER: Dict[str, Any] = {
     'prog': 'linux-xorg-autoscroll',
     'formatter_class': ArgparseFormatter,
-    'description': get_resource_content('resources/txt/prolog.txt'),
+    'description_resource': 'resources/txt/prolog.txt',
     'fromfile_prefix_chars': '@'}
 
 ARGUMENTS: Dict[str, Any] = {
@@ -60,6 +153,67 @@ ARGUMENTS: Dict[str, Any] = {
                      'distance from the point where the scrolling started, '
                      'can be set to 0\n'
                      f'[default: {SCROLLING_ACCELERATION_DISTANCE}]')
+        },
+        'function': {
+            'type': str,
+            'choices': SCROLLING_FUNCTIONS,
+            'help': ('R|how the speed grows with the distance from the '
+                     'starting point, \'linear\' - speed + acceleration * '
+                     'distance, \'quadratic\' - speed + acceleration * '
+                     f'distance ^ 2 / {SCROLLING_CURVE_SCALE}, '
+                     '\'exponential\' - speed + acceleration * '
+                     f'{SCROLLING_CURVE_SCALE} * (e ^ (distance / '
+                     f'{SCROLLING_CURVE_SCALE}) - 1), \'piecewise\' - '
+                     'straight lines between --scrolling-points\n'
+                     f'[default: {SCROLLING_FUNCTION}]')
+        },
+        'points': {
+            'type': str,
+            'help': ('R|speed at given distances for the piecewise '
+                     'function, \'distance:speed\' pairs separated by '
+                     'commas, e.g. 0:300,200:2300,600:8000\n'
+                     '[default: none, the speed is constant]')
+        },
+        'euclidean': {
+            'action': 'store_const',
+            'const': True,
+            'help': ('if set, the speed depends on the straight-line '
+                     'distance from the starting point instead of the '
+                     'larger of the horizontal and vertical ones')
+        },
+        'independent': {
+            'action': 'store_const',
+            'const': True,
+            'help': ('if set, every axis scrolls at its own speed, the speed '
+                     'is split between them by their distances from the '
+                     'starting point, so diagonal scrolling follows the '
+                     'pointer instead of scrolling both axes at the speed '
+                     'of the faster one')
+        },
+        'tick-rate': {
+            'type': int,
+            'help': ('R|maximum number of scroll ticks per second, if set, '
+                     'every tick scrolls for as many units as have '
+                     'accumulated since the previous one, 0 scrolls for 1 '
+                     'unit every tick\n'
+                     f'[default: {SCROLLING_TICK_RATE}]')
+        },
+        'lazy': {
+            'action': 'store_const',
+            'const': True,
+            'help': ('if set, mouse movements only store the latest '
+                     'position, direction and speed are calculated once per '
+                     'scroll tick')
+        },
+        'backend': {
+            'type': str,
+            'choices': SCROLLING_BACKENDS,
+            'help': ('R|how scroll events are sent, \'uinput\' sends '
+                     'high-resolution wheel events through a virtual '
+                     'device, so with --scrolling-tick-rate every tick can '
+                     'scroll for a fraction of a unit, \'recording\' only '
+                     'keeps them in memory\n'
+                     f'[default: {SCROLLING_BACKEND}]')
         }
     },
     'buttons': {
@@ -79,6 +233,44 @@ ARGUMENTS: Dict[str, Any] = {
                      '[default: --buttons-start]')
         }
     },
+    'listener': {
+        'backend': {
+            'type': str,
+            'choices': LISTENER_BACKENDS,
+            'help': ('R|where mouse events come from, \'evdev\' reads them '
+                     f'straight from {LISTENER_DEVICES} instead of going '
+                     'through the x server, distances are then in device '
+                     'units, without pointer acceleration\n'
+                     f'[default: {LISTENER_BACKEND}]')
+        },
+        'device': {
+            'type': str,
+            'help': ('R|input device the evdev backend reads, e.g. '
+                     '/dev/input/by-id/usb-mouse-event-mouse\n'
+                     '[default: every device that moves a pointer]')
+        }
+    },
+    'profiles': {
+        'enable': {
+            'action': 'store_const',
+            'const': True,
+            'help': ('R|if set, the scrolling started over a window with a '
+                     '--profiles-window profile uses the options of that '
+                     'profile, x11 only')
+        },
+        'window': {
+            'type': str,
+            'nargs': '+',
+            'action': 'append',
+            'help': ('R|window class (or instance, the WM_CLASS property) '
+                     'followed by scrolling options for its windows, e.g. '
+                     '--profiles-window xterm speed=100 dead-area=20, can be '
+                     'repeated, options are '
+                     f'{", ".join(PROFILES_OPTIONS)}, the rest are the '
+                     'current ones\n'
+                     '[default: none]')
+        }
+    },
     'config': {
         'enable': {
             'action': 'store_const',
@@ -93,7 +285,9 @@ ARGUMENTS: Dict[str, Any] = {
         'interval': {
             'type': int,
             'help': ('R|how often the config file should be checked for '
-                     f'changes, in seconds\n[default: {CONFIG_INTERVAL}]')
+                     'changes, in seconds, on linux changes are picked up '
+                     'at once and it is only a fallback\n'
+                     f'[default: {CONFIG_INTERVAL}]')
         }
     },
     'icon': {
@@ -111,6 +305,39 @@ ARGUMENTS: Dict[str, Any] = {
             'help': f'R|size of the icon, in pixels\n[default: {ICON_SIZE}]'
         }
     },
+    'metrics': {
+        'enable': {
+            'action': 'store_const',
+            'const': True,
+            'help': ('R|if set, event counters and latency histograms will '
+                     'be written to --metrics-path every --metrics-interval, '
+                     'in prometheus text format')
+        },
+        'path': {
+            'type': str,
+            'help': f'R|path to the metrics file\n[default: {METRICS_PATH}]'
+        },
+        'interval': {
+            'type': int,
+            'help': ('R|how often the metrics file is written, in seconds\n'
+                     f'[default: {METRICS_INTERVAL}]')
+        }
+    },
+    'remote': {
+        'enable': {
+            'action': 'store_const',
+            'const': True,
+            'help': ('R|if set, a unix socket on --remote-path accepts the '
+                     'same options as the command line, one line at a time, '
+                     'and applies them at once, \'status\' returns the '
+                     'current state as json, \'metrics\' returns the '
+                     'metrics in prometheus text format')
+        },
+        'path': {
+            'type': str,
+            'help': f'R|path to the control socket\n[default: {REMOTE_PATH}]'
+        }
+    },
     'debug': {
         'file': {
             'action': 'store_const',
@@ -121,17 +348,39 @@ ARGUMENTS: Dict[str, Any] = {
         'click': {
             'action': 'store_const',
             'const': True,
-            'help': 'if set, click info will be printed to stdout'
+            'help': ('if set, clicks will be traced as json lines to stdout '
+                     'or the trace file')
         },
         'scroll': {
             'action': 'store_const',
             'const': True,
-            'help': 'if set, scroll info will be printed to stdout'
+            'help': ('if set, pointer motion and scroll ticks will be traced '
+                     'as json lines to stdout or the trace file')
         },
         'initial': {
             'action': 'store_const',
             'const': True,
             'help': 'if set, startup configuration will be printed to stdout'
+        },
+        'jitter': {
+            'action': 'store_const',
+            'const': True,
+            'help': ('if set, scroll tick statistics will be printed to '
+                     'stdout once the scrolling ends')
+        },
+        'trace': {
+            'type': str,
+            'help': ('R|file the traced clicks and scrolling are appended '
+                     'to\n[default: stdout]')
+        },
+        'record': {
+            'type': str,
+            'help': ('R|file every click and every pointer motion while '
+                     'scrolling are appended to as compact binary records, '
+                     'for replaying them later with '
+                     'python3 -m autoscroll.autoscroll.replay, rotated '
+                     f'every {DEBUG_RECORD_SIZE // 2**20} MiB\n'
+                     '[default: none]')
         }
     }
 }
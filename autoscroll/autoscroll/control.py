@@ -0,0 +1,119 @@
+from asyncio import (AbstractEventLoop, Event, Server as AsyncioServer,
+                     StreamReader, StreamWriter, get_running_loop,
+                     open_unix_connection, start_unix_server, wait_for)
+from asyncio import TimeoutError as AsyncioTimeoutError
+from errno import EADDRINUSE
+from os import chmod as os_chmod, makedirs as os_makedirs, stat as os_stat
+from os import unlink as os_unlink
+from os.path import dirname as os_path_dirname, exists as os_path_exists
+from socket import AF_UNIX, SOCK_STREAM, socket
+from stat import S_ISSOCK
+from typing import Callable, Set
+from .constants import REMOTE_LINE_MAX, REMOTE_TIMEOUT
+
+
+class Server:
+    """
+    unix socket server, every line a client sends is passed to handle and
+    what it returns is sent back, every client is a coroutine on the loop
+    start is awaited in
+
+    close can be called from any thread, wait_closed returns once it is
+    """
+
+    def __init__(self, path: str, handle: Callable[[str], str]) -> None:
+        self.path = path
+        self.handle = handle
+        self.loop: AbstractEventLoop = None
+        self.server: AsyncioServer = None
+        self.writers: Set[StreamWriter] = set()
+        self.closed: bool = False
+        self.event_closed: Event = None
+
+    async def start(self) -> None:
+        self.loop = get_running_loop()
+        self.event_closed = Event()
+        os_makedirs(os_path_dirname(self.path) or '.', exist_ok=True)
+        if os_path_exists(self.path) and S_ISSOCK(os_stat(self.path).st_mode):
+            await self._remove_stale()
+        # only the user can change the settings, the socket only listens
+        # once its permissions are set, the umask is shared by every thread
+        # and is not changed
+        sock = socket(AF_UNIX, SOCK_STREAM)
+        try:
+            sock.bind(self.path)
+            os_chmod(self.path, 0o600)
+            self.server = await start_unix_server(self._serve, sock=sock,
+                                                  limit=REMOTE_LINE_MAX)
+        except BaseException:
+            sock.close()
+            raise
+        # closed while starting
+        if self.closed:
+            self._close()
+
+    # a socket left over from a previous run is removed, one another
+    # instance is listening on is not
+    async def _remove_stale(self) -> None:
+        try:
+            _, writer = await wait_for(open_unix_connection(self.path),
+                                       REMOTE_TIMEOUT)
+        except ConnectionRefusedError:
+            os_unlink(self.path)
+            return
+        except AsyncioTimeoutError as exception:
+            raise OSError(EADDRINUSE, f'{self.path} is in use') \
+                from exception
+        writer.close()
+        raise OSError(EADDRINUSE, f'{self.path} is in use by another '
+                                  f'instance')
+
+    async def wait_closed(self) -> None: await self.event_closed.wait()
+
+    def close(self) -> None:
+        self.closed = True
+        # not started yet, start closes it
+        if self.loop is None:
+            return
+        try:
+            self.loop.call_soon_threadsafe(self._close)
+        except RuntimeError:
+            # the loop has been closed
+            pass
+
+    def _close(self) -> None:
+        if self.server is None or self.event_closed.is_set():
+            return
+        self.server.close()
+        for writer in self.writers:
+            writer.close()
+        if os_path_exists(self.path):
+            os_unlink(self.path)
+        self.event_closed.set()
+
+    async def _serve(self, reader: StreamReader,
+                     writer: StreamWriter) -> None:
+        self.writers.add(writer)
+        try:
+            while True:
+                try:
+                    # the client has closed its side, the last line may
+                    # have no newline
+                    line = await reader.readline()
+                except ValueError:
+                    writer.write(b'error: the line is too long\n')
+                    await wait_for(writer.drain(), REMOTE_TIMEOUT)
+                    break
+                if not line:
+                    break
+                if line.strip():
+                    writer.write(self.handle(
+                        line.decode(errors='replace')).encode())
+                    # a client that does not read its replies does not
+                    # keep a buffer for long
+                    await wait_for(writer.drain(), REMOTE_TIMEOUT)
+        except (OSError, AsyncioTimeoutError):
+            pass
+        finally:
+            self.writers.discard(writer)
+            writer.close()
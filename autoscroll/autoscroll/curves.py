@@ -0,0 +1,79 @@
+from functools import lru_cache
+from math import exp
+from typing import Callable, Dict, List, Tuple
+from .constants import (SCROLLING_CURVE_SCALE, SCROLLING_ERROR_POINTS,
+                        SCROLLING_INTERVAL_MINIMUM,
+                        SCROLLING_SLEEP_INTERVAL_INITIAL, SCROLLING_TABLE_SIZE)
+
+# (distance, speed) pairs, sorted by distance
+Points = Tuple[Tuple[int, float], ...]
+
+
+def linear(distance: int, speed: int, acceleration: int,
+           points: Points) -> float:
+    # the law before the curves, its intervals only differ once they are
+    # capped at SCROLLING_INTERVAL_MINIMUM and past the end of the table
+    return acceleration * distance + speed
+
+
+def quadratic(distance: int, speed: int, acceleration: int,
+              points: Points) -> float:
+    # the same as linear at SCROLLING_CURVE_SCALE pixels
+    return acceleration * distance * distance / SCROLLING_CURVE_SCALE + speed
+
+
+def exponential(distance: int, speed: int, acceleration: int,
+                points: Points) -> float:
+    # starts as steep as linear, doubles every SCROLLING_CURVE_SCALE * ln 2
+    # pixels
+    return (acceleration * SCROLLING_CURVE_SCALE
+            * (exp(distance / SCROLLING_CURVE_SCALE) - 1) + speed)
+
+
+def piecewise(distance: int, speed: int, acceleration: int,
+              points: Points) -> float:
+    # linear between the points, flat outside of them, speed without them
+    if not points:
+        return speed
+    if distance <= points[0][0]:
+        return points[0][1]
+    for (start, start_speed), (end, end_speed) in zip(points, points[1:]):
+        if distance <= end:
+            return start_speed + ((end_speed - start_speed)
+                                  * (distance - start) / (end - start))
+    return points[-1][1]
+
+
+CURVES: Dict[str, Callable[[int, int, int, Points], float]] = {
+    'linear': linear, 'quadratic': quadratic, 'exponential': exponential,
+    'piecewise': piecewise}
+
+
+def parse_points(value: str) -> Points:
+    # 'distance:speed,distance:speed', e.g. '0:300,200:2300,600:8000'
+    try:
+        points = tuple(sorted((int(distance), float(speed))
+                              for distance, speed in
+                              (point.split(':') for point in
+                               value.replace(' ', '').split(',') if point)))
+    except ValueError as exception:
+        raise ValueError(f'{SCROLLING_ERROR_POINTS}, it is {value}') \
+            from exception
+    if len({distance for distance, _ in points}) != len(points):
+        raise ValueError(f'{SCROLLING_ERROR_POINTS}, it is {value}')
+    return points
+
+
+# every profile keeps its own table, see Scrolling.set_profiles
+@lru_cache(maxsize=32)
+def build_table(function: str, speed: int, acceleration: int,
+                points: Points = (),
+                size: int = SCROLLING_TABLE_SIZE) -> List[float]:
+    # sleep interval for every distance from the starting point, anything
+    # farther than the table uses its last entry
+    curve, table = CURVES[function], []
+    for distance in range(size):
+        value = curve(distance, speed, acceleration, points)
+        table.append(max(abs(100 / value), SCROLLING_INTERVAL_MINIMUM)
+                     if value else SCROLLING_SLEEP_INTERVAL_INITIAL)
+    return table
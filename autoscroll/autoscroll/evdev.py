@@ -0,0 +1,190 @@
+from fcntl import ioctl
+from glob import glob
+from os import O_NONBLOCK, O_RDONLY, close as os_close, open as os_open
+from os import read as os_read
+from os.path import basename as os_path_basename, realpath as os_path_realpath
+from selectors import EVENT_READ, DefaultSelector
+from socket import socketpair
+from struct import calcsize, iter_unpack, pack
+from time import monotonic_ns
+from typing import Callable, Dict, List, Tuple
+from pynput.mouse import Button, Controller
+from .backends import Source
+from .constants import LISTENER_DEVICE, LISTENER_DEVICES, LISTENER_EVENTS_MAX
+from .metrics import Histogram
+from .uinput import (BTN_LEFT, BTN_MIDDLE, BTN_RIGHT, EV_KEY, EV_REL, EV_SYN,
+                     INPUT_EVENT, REL_X, REL_Y, SYN_REPORT)
+
+# linux/input-event-codes.h
+BTN_SIDE: int = 0x113
+BTN_EXTRA: int = 0x114
+
+# linux/input.h, event times on the same clock as monotonic_ns
+EVIOCSCLOCKID: int = 0x400445a0
+CLOCK_MONOTONIC: int = 1
+
+EVENT_SIZE: int = calcsize(INPUT_EVENT)
+# the side buttons are only known to pynput on some platforms
+BUTTONS: Dict[int, Button] = {
+    code: button for code, button in (
+        (BTN_LEFT, Button.left), (BTN_RIGHT, Button.right),
+        (BTN_MIDDLE, Button.middle),
+        (BTN_SIDE, getattr(Button, 'button8', None)),
+        (BTN_EXTRA, getattr(Button, 'button9', None)))
+    if button is not None}
+
+
+def pointers() -> List[str]:
+    # event devices with relative x and y axes
+    paths = []
+    for path in sorted(glob(LISTENER_DEVICES)):
+        try:
+            with open(f'/sys/class/input/{os_path_basename(path)}/device/'
+                      'capabilities/rel') as capabilities:
+                axes = int(capabilities.read().split()[-1], 16)
+        except (OSError, ValueError, IndexError):
+            continue
+        if axes & (1 << REL_X) and axes & (1 << REL_Y):
+            paths.append(path)
+    return paths
+
+
+def position() -> Tuple[int, int]:
+    # where the pointer is on the screen, one round trip to the x server
+    x, y = Controller().position
+    return int(x), int(y)
+
+
+class Listener(Source):
+    """
+    reads mouse events straight from evdev devices, linux only
+
+    every device is read in batches of packed input_event structs, motion
+    is summed up until the end of a report and passed on once per report
+
+    the devices only report how far the mouse has moved, the position is
+    taken from get_position when a button is pressed and moved by the raw
+    motion from there, so distances are in device units, without pointer
+    acceleration
+    """
+
+    def __init__(self, on_move: Callable = None, on_click: Callable = None,
+                 daemon: bool = True, device: str = LISTENER_DEVICE,
+                 latency: Histogram = None,
+                 get_position: Callable[[], Tuple[int, int]] = position
+                 ) -> None:
+        super().__init__(on_move, on_click, daemon)
+        # time from the kernel timestamping an event to its handler
+        self.latency = latency
+        self.get_position = get_position
+        self.x = self.y = 0
+        # motion of a report that has not ended yet
+        self.dx = self.dy = 0
+        self.selector = DefaultSelector()
+        self.fds: List[int] = []
+        # stop wakes the selector up through it
+        self.wake_read, self.wake_write = socketpair()
+        self.selector.register(self.wake_read, EVENT_READ)
+        try:
+            for path in ([os_path_realpath(device)] if device
+                         else pointers()):
+                self._open(path)
+            if not self.fds:
+                raise FileNotFoundError(f'no pointer device in '
+                                        f'{LISTENER_DEVICES}')
+        except OSError:
+            self.close()
+            raise
+
+    def run(self) -> None:
+        try:
+            while not self.event_stop.is_set() and self.fds:
+                for key, _ in self.selector.select():
+                    if key.fileobj is not self.wake_read:
+                        self._read(key.fd)
+        finally:
+            self.close()
+
+    def stop(self) -> None:
+        super().stop()
+        # never started, run does not close the devices
+        if self.thread.ident is None:
+            self.close()
+            return
+        try:
+            self.wake_write.send(b'\0')
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        for fd in self.fds:
+            self.selector.unregister(fd)
+            os_close(fd)
+        self.fds.clear()
+        self.selector.close()
+        self.wake_read.close()
+        self.wake_write.close()
+
+    def _open(self, path: str) -> None:
+        fd = os_open(path, O_RDONLY | O_NONBLOCK)
+        try:
+            self.selector.register(fd, EVENT_READ)
+        except OSError:
+            os_close(fd)
+            raise
+        self.fds.append(fd)
+        try:
+            ioctl(fd, EVIOCSCLOCKID, pack('i', CLOCK_MONOTONIC))
+        except OSError:
+            # realtime timestamps, the latency is not recorded
+            pass
+
+    def _read(self, fd: int) -> None:
+        try:
+            data = os_read(fd, EVENT_SIZE * LISTENER_EVENTS_MAX)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b''
+        if not data:
+            # the device is gone
+            self.selector.unregister(fd)
+            self.fds.remove(fd)
+            os_close(fd)
+            return
+        dx, dy = self.dx, self.dy
+        for seconds, microseconds, kind, code, value in iter_unpack(
+                INPUT_EVENT, data):
+            if kind == EV_REL:
+                if code == REL_X:
+                    dx += value
+                elif code == REL_Y:
+                    dy += value
+            elif kind == EV_SYN and code == SYN_REPORT:
+                if dx or dy:
+                    self.x += dx
+                    self.y += dy
+                    dx = dy = 0
+                    self.on_move(self.x, self.y)
+                    self._record(seconds, microseconds)
+            # 2 is autorepeat
+            elif kind == EV_KEY and code in BUTTONS and value < 2:
+                if value:
+                    self._update_position()
+                self.on_click(self.x, self.y, BUTTONS[code], bool(value))
+                self._record(seconds, microseconds)
+        self.dx, self.dy = dx, dy
+
+    def _update_position(self) -> None:
+        try:
+            self.x, self.y = self.get_position()
+        except Exception:
+            # no display, the position stays relative
+            pass
+
+    def _record(self, seconds: int, microseconds: int) -> None:
+        if self.latency is not None:
+            latency = monotonic_ns() - seconds * 10**9 - microseconds * 1000
+            # realtime timestamps are far off
+            if 0 <= latency < 10**9:
+                self.latency.record(latency)
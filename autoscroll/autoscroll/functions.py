@@ -1,5 +1,4 @@
 from collections import ChainMap
-from importlib.resources import path as importlib_path
 from os.path import isfile as os_isfile
 from typing import Any, Dict, Iterable, List, Tuple, Union
 
@@ -18,13 +17,6 @@ def convert_bool(value: Union[str, bool] = None) -> bool:
 def return_none(*args, **kwargs) -> None: return
 
 
-def return_kwargs(**kwargs) -> Dict[Any, Any]: return kwargs
-
-
-def has_dict(*values: Any) -> bool:
-    return False in (hasattr(value, '__dict__') for value in values)
-
-
 def convert(value: Any) -> Dict[str, Any]:
     if value is None:
         return {}
@@ -48,6 +40,33 @@ def parse_arguments_old(arguments: Dict[str, Any]) -> Dict[str, Any]:
 def construct_coordinates(x: int, y: int) -> str: return f'{{{x}, {y}}}'
 
 
+def diff_arguments(previous: Dict[str, Dict[str, Any]],
+                   current: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    # groups of arguments that are set and differ from the previous ones
+    result = {}
+    for group, arguments in current.items():
+        changed = {name: value for name, value in arguments.items()
+                   if value is not None
+                   and previous.get(group, {}).get(name) != value}
+        if changed:
+            result[group] = changed
+    return result
+
+
+def convert_json(value: Any) -> Any:
+    # anything with a json method (every Base) becomes what it returns,
+    # whatever json cannot take becomes a string
+    if hasattr(value, 'json') and callable(value.json):
+        value = value.json()
+    if isinstance(value, dict):
+        return {str(key): convert_json(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [convert_json(item) for item in value]
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
 def documented_by(original):
     def wrapper(target):
         target.__doc__ = original.__doc__
@@ -75,6 +94,8 @@ def get_path(path: str) -> str:
 
 
 def get_resource_path(resource: str = None) -> str:
+    # importlib.resources is slow to import and is rarely needed
+    from importlib.resources import path as importlib_path
     if resource is None:
         file = ''
         addition = ''
@@ -84,7 +105,8 @@ def get_resource_path(resource: str = None) -> str:
         addition = f'.{addition}' if addition else ''
         file = split[-1]
         file = file if file != addition else ''
-    return str(importlib_path(f'autoscroll{addition}', file))
+    with importlib_path(f'autoscroll{addition}', file) as path:
+        return str(path)
 
 
 def get_resource_content(resource: str) -> str:
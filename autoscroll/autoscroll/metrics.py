@@ -0,0 +1,150 @@
+from time import monotonic_ns
+from typing import Any, Dict, List, Tuple
+
+# every power of two is split into that many buckets, so a recorded value
+# is off by no more than 25%
+SUB_BUCKETS: int = 4
+# 2 ** 40 ns, about 18 minutes, anything longer lands in the last bucket
+BUCKETS: int = 156
+# prometheus gets one bucket per power of two from 1us on, the same on
+# every scrape
+PROMETHEUS_FIRST: int = 35
+
+
+def bucket(value: int) -> int:
+    # log-linear: 0..7 map to themselves, then 4 buckets per power of two
+    if value < 8:
+        return value if value > 0 else 0
+    length = value.bit_length()
+    index = (length - 2) * SUB_BUCKETS + ((value >> (length - 3)) & 3)
+    return index if index < BUCKETS else BUCKETS - 1
+
+
+def bucket_bound(index: int) -> int:
+    # the largest value that lands in the bucket
+    if index < 8:
+        return index
+    shift = index // SUB_BUCKETS - 1
+    return ((5 + index % SUB_BUCKETS) << shift) - 1
+
+
+class Histogram:
+    """
+    fixed log-linear buckets of nanoseconds, recording a value is a bit
+    length and a list increment, nothing is allocated
+    """
+
+    def __init__(self, name: str, help: str) -> None:
+        self.name = name
+        self.help = help
+        self.counts: List[int] = [0] * BUCKETS
+        self.count: int = 0
+        self.total: int = 0
+        self.max: int = 0
+
+    def record(self, value: int) -> None:
+        self.counts[bucket(value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, percentile: float) -> int:
+        # upper bound of the bucket the percentile falls into
+        rank, seen = percentile / 100 * self.count, 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                return min(bucket_bound(index), self.max)
+        return 0
+
+    def prometheus(self, prefix: str) -> List[str]:
+        name = f'{prefix}_{self.name}_seconds'
+        lines = [f'# HELP {name} {self.help}', f'# TYPE {name} histogram']
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if index < PROMETHEUS_FIRST or index % SUB_BUCKETS != 3:
+                continue
+            lines.append(f'{name}_bucket{{le="{bucket_bound(index) / 1e9:g}"}}'
+                         f' {seen}')
+        lines.extend((f'{name}_bucket{{le="+Inf"}} {self.count}',
+                      f'{name}_sum {self.total / 1e9:g}',
+                      f'{name}_count {self.count}'))
+        return lines
+
+    def json(self) -> Dict[str, Any]:
+        return {'count': self.count,
+                'average': f'{self.total / (self.count or 1) / 1e3:.0f}us',
+                'p50': f'{self.percentile(50) / 1e3:.0f}us',
+                'p99': f'{self.percentile(99) / 1e3:.0f}us',
+                'max': f'{self.max / 1e3:.0f}us'}
+
+
+class Collector:
+    """
+    counters and histograms updated by the listener, scroll and config
+    threads, always on, every update is an attribute increment or a
+    histogram record
+    """
+
+    # name, help
+    COUNTERS: Tuple[Tuple[str, str], ...] = (
+        ('motion_events', 'pointer motion events while scrolling'),
+        ('clicks', 'mouse button presses and releases'),
+        ('scrolls', 'scroll ticks that scrolled'),
+        ('ticks_missed', 'ticks that were late and scrolled at once'),
+        ('config_reloads', 'config file checks'))
+
+    def __init__(self) -> None:
+        self.start: int = monotonic_ns()
+        self.motion_events: int = 0
+        self.clicks: int = 0
+        self.scrolls: int = 0
+        self.ticks_missed: int = 0
+        self.config_reloads: int = 0
+        # monotonic time of the click that started the scrolling, until the
+        # first scroll
+        self.scroll_started: int = 0
+        self.click = Histogram('click', 'time spent handling a click')
+        self.scroll_start = Histogram(
+            'scroll_start', 'time from the click that starts the scrolling '
+                            'to the first scroll, including the time the '
+                            'pointer stays in the dead area')
+        self.tick_lateness = Histogram(
+            'tick_lateness', 'time between a tick deadline and the scroll '
+                             'thread waking up')
+        self.config_reload = Histogram(
+            'config_reload', 'time spent checking, parsing and applying the '
+                             'config file')
+        self.input_latency = Histogram(
+            'input_latency', 'time from the kernel timestamping a mouse '
+                             'event to its handler, evdev listener only')
+        self.histograms: Tuple[Histogram, ...] = (
+            self.click, self.scroll_start, self.tick_lateness,
+            self.config_reload, self.input_latency)
+
+    def prometheus(self, prefix: str = 'autoscroll') -> str:
+        lines = [f'# HELP {prefix}_uptime_seconds time since the start',
+                 f'# TYPE {prefix}_uptime_seconds gauge',
+                 f'{prefix}_uptime_seconds '
+                 f'{(monotonic_ns() - self.start) / 1e9:g}']
+        for name, help in self.COUNTERS:
+            lines.extend((f'# HELP {prefix}_{name}_total {help}',
+                          f'# TYPE {prefix}_{name}_total counter',
+                          f'{prefix}_{name}_total {getattr(self, name)}'))
+        for histogram in self.histograms:
+            lines.extend(histogram.prometheus(prefix))
+        return '\n'.join(lines) + '\n'
+
+    def json(self) -> Dict[str, Any]:
+        uptime = (monotonic_ns() - self.start) / 1e9
+        result: Dict[str, Any] = {'uptime': f'{uptime:.0f}s'}
+        for name, _ in self.COUNTERS:
+            result[name] = getattr(self, name)
+        result['motion events per second'] = \
+            f'{self.motion_events / (uptime or 1):.1f}'
+        result['scrolls per second'] = f'{self.scrolls / (uptime or 1):.1f}'
+        for histogram in self.histograms:
+            result[histogram.name] = histogram.json()
+        return result
@@ -1,19 +1,157 @@
-from PySide6.QtSvgWidgets import QSvgWidget
-from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt
-from sys import argv as sys_argv
-from .functions import get_path
+from functools import lru_cache
+from PySide6.QtSvg import QSvgRenderer
+from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtGui import QColor, QPainter, QPixmap, QPolygonF
+from PySide6.QtCore import (QPoint, QPointF, QSocketNotifier, Qt, QTimer,
+                            Signal)
+from ctypes import c_ssize_t
+from os import stat as os_stat
+from signal import set_wakeup_fd as signal_set_wakeup_fd
+from socket import socketpair
+from sys import argv as sys_argv, version_info as sys_version_info
+from typing import Callable, Optional, Tuple
+from .constants import ICON_ARROW_COLOR, ICON_CACHE_SIZE
+from .functions import get_path, return_none
 
-application = QApplication(sys_argv)
-application.setQuitOnLastWindowClosed(False)
+application: QApplication = None
 
+# shiboken6 6.12 returns None, True and False from the methods it wraps
+# without a new reference, as if they were immortal, which they are only
+# from python 3.12. before that every call to a method returning None (move,
+# show, hide, update, QTimer.start) takes a reference away from None, a
+# click takes about 9, and the process aborts once there are none left,
+# after a few hundred clicks or at exit. their reference counts are raised
+# as far as 3.12 does for immortal objects, so they are never freed
+if sys_version_info < (3, 12):
+    for immortal in (None, True, False):
+        c_ssize_t.from_address(id(immortal)).value += 1 << 32
 
-class Icon(QSvgWidget):
 
-    def __init__(self, path: str, size: int) -> None:
+def get_application() -> QApplication:
+    # created on demand, importing the module does not start anything
+    global application
+    if application is None:
+        application = QApplication(sys_argv)
+        application.setQuitOnLastWindowClosed(False)
+    return application
+
+
+def exec_application() -> int:
+    # in the main thread, python signal handlers only run once python code
+    # does, exec() could wait in qt for an event that never comes, so a
+    # signal also writes to a socket that wakes the event loop
+    reader, writer = socketpair()
+    reader.setblocking(False)
+    writer.setblocking(False)
+    previous = signal_set_wakeup_fd(writer.fileno(),
+                                    warn_on_full_buffer=False)
+    notifier = QSocketNotifier(reader.fileno(), QSocketNotifier.Read)
+    notifier.activated.connect(lambda *_: reader.recv(4096))
+    try:
+        return get_application().exec()
+    finally:
+        signal_set_wakeup_fd(previous)
+        notifier.setEnabled(False)
+        reader.close()
+        writer.close()
+
+
+# the file is identified by its stamp too, so an svg edited in place is
+# rasterized again, None if it cannot be read
+def get_stamp(file: str) -> Optional[Tuple[int, int, int]]:
+    try:
+        stat = os_stat(file)
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+# the svg is rasterized once per path, stamp, size and device pixel ratio
+@lru_cache(maxsize=ICON_CACHE_SIZE)
+def render(path: str, stamp: Optional[Tuple[int, int, int]], size: int,
+           ratio: float) -> QPixmap:
+    renderer = QSvgRenderer(get_path(path))
+    renderer.setAspectRatioMode(Qt.KeepAspectRatio)
+    pixmap = QPixmap(round(size * ratio), round(size * ratio))
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    renderer.render(painter)
+    painter.end()
+    pixmap.setDevicePixelRatio(ratio)
+    return pixmap
+
+
+# index of the variant for a direction, (0, 0) is the plain icon
+def get_variant(direction: Tuple[int, int]) -> int:
+    return (direction[1] + 1) * 3 + direction[0] + 1
+
+
+# the icon with an arrow pointing from the starting point to the pointer,
+# one for each of the 9 directions
+@lru_cache(maxsize=ICON_CACHE_SIZE)
+def render_variants(path: str, stamp: Optional[Tuple[int, int, int]],
+                    size: int, ratio: float) -> Tuple[QPixmap, ...]:
+    icon = render(path, stamp, size, ratio)
+    variants = []
+    for y in (-1, 0, 1):
+        for x in (-1, 0, 1):
+            if not x and not y:
+                variants.append(icon)
+                continue
+            pixmap = QPixmap(icon)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(ICON_ARROW_COLOR))
+            painter.drawPolygon(get_arrow(-x, -y, size))
+            painter.end()
+            variants.append(pixmap)
+    return tuple(variants)
+
+
+def clear_cache() -> None:
+    # pixmaps must not outlive the application
+    render.cache_clear()
+    render_variants.cache_clear()
+
+
+def get_arrow(x: int, y: int, size: int) -> QPolygonF:
+    # a triangle near the edge of the icon, pointing towards (x, y)
+    half = size / 2
+    length = (x * x + y * y) ** 0.5
+    x, y = x / length, y / length
+    tip = QPointF(half + x * half * 0.95, half + y * half * 0.95)
+    base = QPointF(half + x * half * 0.55, half + y * half * 0.55)
+    side = QPointF(-y * half * 0.3, x * half * 0.3)
+    return QPolygonF((tip, base + side, base - side))
+
+
+class Icon(QWidget):
+
+    # requests from other threads (the listener, the config file), they
+    # are queued and handled in the thread the widget lives in, every one
+    # handled costs references to None and True before python 3.12, see
+    # above
+    request_show = Signal(int, int)
+    request_hide = Signal()
+    request_update = Signal(str, int)
+    request_quit = Signal()
+
+    def __init__(self, path: str, size: int,
+                 get_direction: Callable[[], Tuple[int, int]] = None) -> None:
         super().__init__()
+        self.request_show.connect(self.show, Qt.QueuedConnection)
+        self.request_hide.connect(self.hide, Qt.QueuedConnection)
+        self.request_update.connect(self.update_icon, Qt.QueuedConnection)
+        self.request_quit.connect(self.quit, Qt.QueuedConnection)
+        self.icon_ratio = self.devicePixelRatioF()
+        self.get_direction = get_direction or return_none
+        self.variant = get_variant((0, 0))
+        # the direction is checked once per frame while the icon is shown,
+        # so a fast pointer cannot flood the event loop
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.update_direction)
         self.update_icon(path, size)
-        self.renderer().setAspectRatioMode(Qt.KeepAspectRatio)
         self.setWindowFlags(Qt.FramelessWindowHint
                             | Qt.WindowStaysOnTopHint
                             | Qt.WindowTransparentForInput
@@ -22,11 +160,62 @@ class Icon(QSvgWidget):
         self.setAttribute(Qt.WA_TranslucentBackground)
 
     def update_icon(self, path: str, size: int) -> None:
-        self.load(get_path(path))
-        self.icon_size = size
-        self.resize(size, size)
+        self.icon_path = path
+        # resolved once, a packaged resource is slow to look up
+        self.icon_file = get_path(path)
+        self.icon_stamp = get_stamp(self.icon_file)
+        self.variants = render_variants(path, self.icon_stamp, size,
+                                        self.icon_ratio)
+        pixmap = self.variants[self.variant]
+        if getattr(self, 'icon_size', None) != size:
+            self.icon_size = size
+            self.resize(size, size)
+        if pixmap is not getattr(self, 'pixmap', None):
+            self.pixmap = pixmap
+            self.update()
+
+    def update_direction(self) -> None:
+        direction = self.get_direction()
+        if direction is None:
+            return
+        # repaint only if the direction has changed
+        variant = get_variant(direction)
+        if variant == self.variant:
+            return
+        self.variant = variant
+        self.pixmap = self.variants[variant]
+        self.update()
 
     def show(self, x_current: int, y_current: int) -> None:
+        # screens can have different device pixel ratios
+        screen = QApplication.screenAt(QPoint(x_current, y_current))
+        ratio = self.icon_ratio if screen is None \
+            else screen.devicePixelRatio()
+        if ratio != self.icon_ratio \
+                or get_stamp(self.icon_file) != self.icon_stamp:
+            self.icon_ratio = ratio
+            self.update_icon(self.icon_path, self.icon_size)
         half_size = self.icon_size // 2
         self.move(x_current - half_size, y_current - half_size)
         super().show()
+
+    def quit(self) -> None:
+        self.hide()
+        self.variants = ()
+        self.pixmap = QPixmap()
+        clear_cache()
+        get_application().quit()
+
+    def showEvent(self, event) -> None:
+        rate = self.screen().refreshRate() if self.screen() else 0
+        self.timer.start(max(1, round(1000 / (rate or 60))))
+        super().showEvent(event)
+
+    def hideEvent(self, event) -> None:
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def paintEvent(self, event) -> None:
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self.pixmap)
+        painter.end()
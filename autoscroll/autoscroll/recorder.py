@@ -0,0 +1,151 @@
+from atexit import register as atexit_register
+from mmap import ACCESS_READ, mmap
+from os import replace as os_replace
+from struct import Struct, calcsize, error as StructError, iter_unpack
+from struct import pack, unpack_from
+from threading import Lock
+from time import monotonic_ns
+from typing import BinaryIO, Callable, Iterator, Tuple
+from pynput.mouse import Button
+from .constants import DEBUG_RECORD_BUFFER, DEBUG_RECORD_SIZE
+from .functions import return_none
+from .tracer import BUTTON_INDEXES, BUTTONS, CLICK, MOVE
+
+# monotonic time in nanoseconds, x, y, kind (tracer.MOVE or tracer.CLICK),
+# index of the button in tracer.BUTTONS, pressed, padding, little-endian
+RECORD: str = '<qiiBBBx'
+RECORD_SIZE: int = calcsize(RECORD)
+RECORD_STRUCT: Struct = Struct(RECORD)
+# at the start of every file: magic, version, record size
+HEADER: str = '<4sHH'
+HEADER_SIZE: int = calcsize(HEADER)
+MAGIC: bytes = b'ASIR'
+VERSION: int = 1
+
+
+class Recorder:
+    """
+    passes every event on to on_move_next and on_click_next and appends it
+    to a file as a fixed-size binary record
+
+    records are packed into a buffer that is written once it is full and
+    after every click, once the click has been handled, so the listener
+    thread only makes a system call every DEBUG_RECORD_BUFFER motion
+    events. the file is rotated once it grows past size, the previous one
+    is kept with a '.1' suffix
+
+    the buffer is also flushed from other threads, when the recording is
+    turned off or moved and at exit, so every access to it holds the lock,
+    the listener thread is the only one taking it while recording
+    """
+
+    def __init__(self, size: int = DEBUG_RECORD_SIZE,
+                 buffer: int = DEBUG_RECORD_BUFFER) -> None:
+        # set by Listener.record
+        self.on_move_next: Callable = return_none
+        self.on_click_next: Callable = return_none
+        self.size = size
+        self.buffer: bytearray = bytearray(RECORD_SIZE * buffer)
+        self.pack_into: Callable = RECORD_STRUCT.pack_into
+        self.offset: int = 0
+        self.end: int = len(self.buffer)
+        self.path: str = None
+        self.file: BinaryIO = None
+        self.lock: Lock = Lock()
+        self.registered: bool = False
+
+    # pynput passes whether the event was injected as well, it is not
+    # recorded
+    def on_move(self, x: int, y: int, *args) -> None:
+        time = monotonic_ns()
+        self.on_move_next(x, y)
+        # acquire and release directly, a with block costs twice as much
+        # here
+        lock = self.lock
+        lock.acquire()
+        try:
+            offset = self.offset
+            try:
+                self.pack_into(self.buffer, offset, time, x, y, MOVE, 0, 0)
+            except StructError:
+                # fractional positions on some platforms
+                self.pack_into(self.buffer, offset, time, int(x), int(y),
+                               MOVE, 0, 0)
+            self.offset = offset = offset + RECORD_SIZE
+            if offset == self.end:
+                self._flush()
+        finally:
+            lock.release()
+
+    def on_click(self, x: int, y: int, button: Button, pressed: bool,
+                 *args) -> None:
+        time = monotonic_ns()
+        self.on_click_next(x, y, button, pressed)
+        with self.lock:
+            self.pack_into(self.buffer, self.offset, time, int(x), int(y),
+                           CLICK, BUTTON_INDEXES.get(button, 0), pressed)
+            self.offset += RECORD_SIZE
+            self._flush()
+
+    def open(self, path: str) -> None:
+        # appended to, the header is only written to a new file
+        with self.lock:
+            self._flush()
+            self._close()
+            self.file = open(path, 'ab', buffering=0)
+            self.path = path
+            if not self.file.tell():
+                self.file.write(pack(HEADER, MAGIC, VERSION, RECORD_SIZE))
+        if not self.registered:
+            self.registered = True
+            atexit_register(self.close)
+
+    def close(self) -> None:
+        with self.lock:
+            self._flush()
+            self._close()
+
+    def flush(self) -> None:
+        with self.lock:
+            self._flush()
+
+    # with the lock held
+    def _flush(self) -> None:
+        offset, self.offset = self.offset, 0
+        if self.file is None or not offset:
+            return
+        self.file.write(self.buffer[:offset])
+        if self.file.tell() >= self.size:
+            self._close()
+            os_replace(self.path, f'{self.path}.1')
+            self.file = open(self.path, 'ab', buffering=0)
+            self.file.write(pack(HEADER, MAGIC, VERSION, RECORD_SIZE))
+
+    def _close(self) -> None:
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+def read(path: str) -> Iterator[Tuple]:
+    """
+    the events of a recording as ReplaySource takes them, (time, x, y) for
+    pointer motion and (time, x, y, button, pressed) for clicks, unpacked
+    straight from the mapped file, a record cut short is skipped
+    """
+    with open(path, 'rb') as file, \
+            mmap(file.fileno(), 0, access=ACCESS_READ) as data:
+        try:
+            magic, version, size = unpack_from(HEADER, data)
+        except StructError as exception:
+            raise ValueError(f'{path} is not an input recording') \
+                from exception
+        if magic != MAGIC or version != VERSION or size != RECORD_SIZE:
+            raise ValueError(f'{path} is not an input recording, or one of '
+                             f'another version')
+        end = HEADER_SIZE + (len(data) - HEADER_SIZE) // size * size
+        with memoryview(data) as view:
+            for time, x, y, kind, button, pressed in iter_unpack(
+                    RECORD, view[HEADER_SIZE:end]):
+                yield ((time, x, y) if kind == MOVE
+                       else (time, x, y, BUTTONS[button], bool(pressed)))
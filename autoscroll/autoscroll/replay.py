@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# replays an input recording made with --debug-record and prints the scroll
+# events it causes
+#
+# python3 -m autoscroll.autoscroll.replay [-s SPEED] [-o OUTPUT] path
+#                                         [autoscroll options ...]
+
+from argparse import ArgumentParser
+from time import monotonic_ns
+from typing import List, Sequence, Tuple, Union
+from .autoscroll import Autoscroll
+from .backends import ReplaySource
+from .recorder import read
+
+
+def replay(path: str, speed: float = 1, options: Sequence[str] = ()
+           ) -> List[Tuple[int, Union[int, float], Union[int, float]]]:
+    """
+    scroll events (time, dx, dy) caused by replaying a recording through
+    Autoscroll with the given command line options, times are in
+    nanoseconds since the replay started, at the recorded speed
+
+    the scroll loop runs in real time whatever the speed, a faster replay
+    scrolls less, with speed set to 0 the events are replayed as fast as
+    possible, which exercises the handlers but leaves the scroll loop no
+    time to scroll
+    """
+    def source(**kwargs) -> ReplaySource:
+        return ReplaySource(events=read(path), speed=speed, **kwargs)
+    autoscroll = Autoscroll(source=source)
+    autoscroll.update(**autoscroll.config.parse_string(' '.join(options)))
+    # scroll events are kept, nothing else runs
+    autoscroll.update(scrolling={'backend': 'recording'},
+                      icon={'enable': False}, config={'enable': False},
+                      metrics={'enable': False}, remote={'enable': False},
+                      profiles={'enable': False}, debug={'record': ''})
+    autoscroll.thread_loop.start()
+    start = monotonic_ns()
+    autoscroll.thread_scroll_listener.start()
+    autoscroll.thread_scroll_listener.join()
+    autoscroll.stop()
+    autoscroll.thread_loop.join()
+    return [(int((time - start) * (speed or 1)), dx, dy)
+            for time, dx, dy in autoscroll.scrolling.controller.events]
+
+
+def main() -> None:
+    parser = ArgumentParser(
+        prog='python3 -m autoscroll.autoscroll.replay',
+        description=('replays a recording made with --debug-record and '
+                     'prints the scroll events it causes, one per line: '
+                     'milliseconds since the start, dx, dy. the rest of the '
+                     'arguments are autoscroll options, e.g. the ones it '
+                     'was recorded with, a profile it was recorded with is '
+                     'not known'))
+    parser.add_argument('path', help='the recording')
+    parser.add_argument('-s', '--speed', type=float, default=1,
+                        help=('how many times faster than recorded, 0 '
+                              'replays as fast as possible [default: 1]'))
+    parser.add_argument('-o', '--output', help='file, stdout by default')
+    arguments, options = parser.parse_known_args()
+    lines = [f'{time / 1e6:.3f} {dx} {dy}\n' for time, dx, dy in
+             replay(arguments.path, arguments.speed, options)]
+    if arguments.output is None:
+        print(''.join(lines), end='')
+        return
+    with open(arguments.output, 'w') as output:
+        output.writelines(lines)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,11 @@
+from asyncio import AbstractEventLoop, Future, get_running_loop
+from asyncio import sleep as asyncio_sleep
+from inspect import signature
 from sys import argv as sys_argv
-from threading import Event
-from time import sleep
-from pynput.mouse import Button, Controller, Listener
+from threading import Event, Lock
+from time import monotonic_ns
+from math import hypot
+from pynput.mouse import Button, Controller, Listener as PynputListener
 from .constants import (
     ARGUMENTS,
     BUTTONS_HOLD,
@@ -10,30 +14,71 @@ from .constants import (
     CONFIG_ERROR_ENABLE,
     CONFIG_PATH,
     CONFIG_INTERVAL,
-    COORDINATE_NAME,
     DEBUG_CLICK,
     DEBUG_FILE,
     DEBUG_INITIAL,
+    DEBUG_JITTER,
+    DEBUG_ERROR_RECORD,
     DEBUG_PADDING,
+    DEBUG_RECORD,
     DEBUG_SCROLL,
+    DEBUG_TRACE,
     ICON_ENABLE,
     ICON_ERROR,
     ICON_PATH,
     ICON_SIZE,
+    LISTENER_BACKEND,
+    LISTENER_BACKENDS,
+    LISTENER_DEVICE,
+    LISTENER_ERROR_BACKEND,
+    METRICS_ENABLE,
+    METRICS_ERROR_INTERVAL,
+    METRICS_INTERVAL,
+    METRICS_PATH,
     PARSER_INITIALIZER,
+    PROFILES_ENABLE,
+    PROFILES_ERROR_ENABLE,
+    PROFILES_ERROR_WINDOW,
+    PROFILES_OPTIONS,
+    PROFILES_WINDOW,
+    REMOTE_ENABLE,
+    REMOTE_ERROR_ENABLE,
+    REMOTE_PATH,
     SCROLLING_ACCELERATION_DISTANCE,
+    SCROLLING_BACKEND,
+    SCROLLING_BACKENDS,
+    SCROLLING_CATCH_UP,
     SCROLLING_DEAD_AREA,
+    SCROLLING_ERROR_BACKEND,
+    SCROLLING_EUCLIDEAN,
+    SCROLLING_FUNCTION,
+    SCROLLING_FUNCTIONS,
+    SCROLLING_INDEPENDENT,
+    SCROLLING_POINTS,
+    SCROLLING_LAZY,
     SCROLLING_SLEEP_INTERVAL_INITIAL,
-    SCROLLING_SPEED)
-from .functions import check_iterable, construct_coordinates, convert_bool, has_dict, raise_type_error, return_kwargs, return_none
+    SCROLLING_SPEED,
+    SCROLLING_TICK_RATE,
+    SCROLLING_WAKE_RATIO)
+from .functions import check_iterable, construct_coordinates, convert_bool, diff_arguments, raise_type_error, return_none
 from .arguments import ArgparseParser, parse_arguments
+from .backends import RecordingSink, Sink, Source
+from .control import Server
+from .curves import Points, build_table, parse_points
+from .metrics import Collector, Histogram
+from .recorder import Recorder
+from .tracer import Tracer
+from .watcher import Watcher
 from typing import Any, Callable, Dict, Iterable, List, Tuple, Type, Union
 from threading import Event, Thread
-from os import stat as os_stat
+from os import makedirs as os_makedirs, replace as os_replace, stat as os_stat
+from os.path import dirname as os_path_dirname
 
 
 class Base:
 
+    __slots__ = ()
+
     debug_keys_ignore = []
     debug_keys_only = []
 
@@ -43,6 +88,12 @@ class Base:
 
     def __init__(self, *args, **kwargs) -> None: self.update(*args, **kwargs)
 
+    # every option update takes as it is now, passing them back to update
+    # restores them, None for the ones that are not set yet
+    def _get_arguments(self) -> Dict[str, Any]:
+        return {name: getattr(self, name, None)
+                for name in signature(self.update).parameters}
+
     def _set_if_nonexistent(self, name: str, value: Any) -> None:
         return None if hasattr(self, name) else setattr(self, name, value)
 
@@ -80,21 +131,6 @@ class Base:
                              'conversion function is not callable')
         return raise_type_error(_value, (type(None), _type))
 
-    def _loop(self, condition: Callable = return_none,
-              action: Callable = return_none,
-              condition_getter: Callable = return_kwargs,
-              action_getter: Callable = return_kwargs,
-              condition_parameters: Dict[str, Any] = {},
-              action_parameters: Dict[str, Any] = {}) -> None:
-
-        if False in list(map(callable, (condition, action, condition_getter,
-                                        action_getter))):
-            raise TypeError(f'some functions are not callable')
-        if not has_dict(condition_parameters, action_parameters):
-            raise TypeError('parameters should have \'__dict__\' attribute')
-        while condition(**condition_getter(**condition_parameters)):
-            action(**action_getter(**action_parameters))
-
     def _print(self, header: str, do_print: bool = True,
                keys_only: List[str] = None,
                keys_ignore: List[str] = None) -> str:
@@ -137,135 +173,93 @@ class Base:
         return _header.ljust(DEBUG_PADDING, ' ') + result
 
 
-class Coordinate(Base):
-
-    def update(self, current: Union[int, str] = None,
-               previous: Union[int, str] = None,
-               initial: Union[int, str] = None) -> None:
-        self.initial: int = initial
-        self.previous: int = previous
-        self.current: int = current
-
-    def distance(self, absolute: bool = False) -> int:
-        distance = self.initial - self.current
-        return abs(distance) if absolute else distance
-
-    def direction(self) -> int:
-        # direction > 0 -> 1, direction == 0 -> 0, direction < 0 -> -1
-        return (self.distance() == 0) + (1 if self.distance() > 0 else -1)
-
-    @property
-    def current(self) -> int: return self._current
-
-    @property
-    def previous(self) -> int: return self._previous
-
-    @property
-    def initial(self) -> int: return self._initial
-
-    @current.setter
-    def current(self, value: int) -> None:
-        _current = getattr(self, '_current', None)
-        self._set('_current', 0, value, (str, int), int)
-        self._set('_previous', 0, _current, (str, int), int)
-
-    @previous.setter
-    def previous(self, value: int) -> None:
-        self._set('_previous', 0, value, (str, int), int)
-
-    @initial.setter
-    def initial(self, value: int) -> None:
-        self._set('_initial', 0, value, (str, int), int)
-
-    def json(self) -> Dict[str, Any]:
-        return {'current': self.current, 'previous': self.previous,
-                'initial': self.initial}
-
-
-class Coordinates(Base):
-
-    def update(self, x: Union[Coordinate, str, int] = None,
-               y: Union[Coordinate, str, int] = None,
-               name: str = None) -> None:
-        self.x: Coordinate = x
-        self.y: Coordinate = y
-        self.name: str = self._convert(name, COORDINATE_NAME, str)
-
-    def direction(self) -> Tuple[int, int]:
-        return (self.x.direction(), self.y.direction())
-
-    def distance(self, absolute: bool = False,
-                 reverse: bool = False) -> Tuple[int, int]:
-        x, y = self.x.distance(absolute), self.y.distance(absolute)
-        return (-x, -y) if reverse else (x, y)
-
-    @property
-    def x(self) -> Coordinate: return self._x
-
-    @property
-    def y(self) -> Coordinate: return self._y
-
-    @property
-    def current(self) -> Tuple[int, int]:
-        return (self.x.current, self.y.current)
-
-    @property
-    def initial(self) -> Tuple[int, int]:
-        return (self.x.initial, self.y.initial)
-
-    @property
-    def previous(self) -> Tuple[int, int]:
-        return (self.x.previous, self.y.previous)
-
-    @y.setter
-    def y(self, value: Union[str, int, Coordinate]) -> None:
-        self._set('_y', Coordinate(), value, (Coordinate, str, int),
-                  self._convert_coordinate, name='_y')
-
-    @x.setter
-    def x(self, value: Union[str, int, Coordinate]) -> None:
-        self._set('_x', Coordinate(), value, (Coordinate, str, int),
-                  self._convert_coordinate, name='_x')
-
-    @current.setter
-    def current(self, value: Tuple[Union[str, int], Union[str, int]]) -> None:
-        self.x.current, self.y.current = self._convert(
-            value, (None, None), Iterable, self._convert_iterable)
+# dead area, sleep interval by distance, euclidean, independent, see
+# Motion.configure
+MotionConfiguration = Tuple[int, List[float], bool, bool]
+
+
+class Motion(Base):
+    """
+    pointer motion state for the listener thread
+
+    every field is a plain int (or float for the interval and the shares),
+    values are validated once in Scrolling setters, `move` is called on
+    every pointer motion event and only allocates in the independent and
+    euclidean modes
+
+    the interval is the one of the faster axis, each axis scrolls for its
+    share of a unit every interval, the shares are 1 unless the axes are
+    independent
+    """
+
+    __slots__ = ('x', 'y', 'initial_x', 'initial_y', 'direction_x',
+                 'direction_y', 'interval', 'share_x', 'share_y',
+                 'dead_area', 'table', 'euclidean', 'independent')
+
+    def __init__(self) -> None:
+        self.x = self.y = self.initial_x = self.initial_y = 0
+        self.direction_x = self.direction_y = 0
+        self.interval: float = SCROLLING_SLEEP_INTERVAL_INITIAL
+        self.share_x: float = 1
+        self.share_y: float = 1
+        self.dead_area: int = SCROLLING_DEAD_AREA
+        # sleep interval by distance, see curves.build_table
+        self.table: List[float] = build_table(
+            SCROLLING_FUNCTION, SCROLLING_SPEED,
+            SCROLLING_ACCELERATION_DISTANCE)
+        self.euclidean: bool = SCROLLING_EUCLIDEAN
+        self.independent: bool = SCROLLING_INDEPENDENT
+
+    def configure(self, dead_area: int, table: List[float],
+                  euclidean: bool = SCROLLING_EUCLIDEAN,
+                  independent: bool = SCROLLING_INDEPENDENT) -> None:
+        self.dead_area, self.table = dead_area, table
+        self.euclidean, self.independent = euclidean, independent
+        self.share_x = self.share_y = 1
+        self.move(self.x, self.y)
+
+    def start(self, x: int, y: int) -> None:
+        self.initial_x, self.initial_y = x, y
+
+    def move(self, x: int, y: int) -> None:
+        self.x, self.y = x, y
+        distance_x, distance_y = self.initial_x - x, self.initial_y - y
+        absolute_x, absolute_y = abs(distance_x), abs(distance_y)
+        if absolute_x <= self.dead_area and absolute_y <= self.dead_area:
+            self.direction_x = self.direction_y = 0
+        else:
+            # direction > 0 -> 1, direction == 0 -> 0, direction < 0 -> -1
+            self.direction_x = (distance_x > 0) - (distance_x < 0)
+            self.direction_y = (distance_y > 0) - (distance_y < 0)
+        major = absolute_x if absolute_x > absolute_y else absolute_y
+        if self.euclidean:
+            hypotenuse = hypot(absolute_x, absolute_y)
+            distance = int(hypotenuse)
+        else:
+            distance = major
+        try:
+            self.interval = self.table[distance]
+        except IndexError:
+            self.interval = self.table[-1]
+        if not self.independent or not major:
+            return
+        # the speed along the line to the pointer is split between the
+        # axes, the faster one gets a whole unit every interval
+        if self.euclidean:
+            self.interval *= hypotenuse / major
+        self.share_x = absolute_x / major
+        self.share_y = absolute_y / major
 
-    @initial.setter
-    def initial(self, value: Tuple[Union[str, int], Union[str, int]]) -> None:
-        self.x.initial, self.y.initial = self._convert(
-            value, (None, None), Iterable, self._convert_iterable)
-
-    @previous.setter
-    def previous(self, value: Tuple[Union[str, int], Union[str, int]]) -> None:
-        self.x.previous, self.y.previous = self._convert(
-            value, (None, None), Iterable, self._convert_iterable)
-
-    def _convert_coordinate(self, value: Union[Coordinate, int],
-                            name: str) -> Coordinate:
-        if isinstance(value, (int, str)):
-            coordinate = getattr(self, name)
-            setattr(coordinate, 'current', int(value))
-            return coordinate
-        return raise_type_error(value, Coordinate)
-
-    def _convert_iterable(self, value: Any) -> Tuple[int, int]:
-        raise_type_error(value, Iterable)
-        x, y = None, None
-        if len(value) >= 1:
-            x = self._convert(value[0], None, (str, int), int)
-        if len(value) >= 2:
-            y = self._convert(value[1], None, (str, int), int)
-        return x, y
+    def is_dead_area(self) -> bool:
+        return (abs(self.initial_x - self.x) <= self.dead_area
+                and abs(self.initial_y - self.y) <= self.dead_area)
 
     def json(self) -> Dict[str, Any]:
-        coordinates = {'direction': str(self.direction()),
-                       'distance': str(self.distance())}
-        coordinates.update({item: construct_coordinates(getattr(self.x, item),
-                                                        getattr(self.y, item))
-                            for item in ('current', 'previous', 'initial')})
-        return coordinates
+        return {'current': construct_coordinates(self.x, self.y),
+                'initial': construct_coordinates(self.initial_x,
+                                                 self.initial_y),
+                'direction': construct_coordinates(self.direction_x,
+                                                   self.direction_y)}
 
 
 class Buttons(Base):
@@ -342,15 +336,362 @@ class Buttons(Base):
                 'pressed': self.is_pressed}
 
 
+class Listener(Base):
+    """
+    where mouse events come from, the source is created by create and
+    replaced when the backend or the device changes, a running source is
+    stopped and the new one started
+
+    pointer motion is only passed to on_move while attached, with a
+    recorder every event goes through it first
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        # set before create is called
+        self.on_move: Callable = return_none
+        self.on_click: Callable = return_none
+        # overrides the backend, anything that follows backends.Source
+        self.factory: Callable[..., Source] = None
+        # evdev only, see evdev.Listener
+        self.latency: Histogram = None
+        self.source: Source = None
+        # on_move and on_click as the source calls them, pynput wraps them,
+        # and what it calls while attached
+        self.on_move_source: Callable = return_none
+        self.on_click_source: Callable = return_none
+        self.on_move_attached: Callable = return_none
+        self.recorder: Recorder = None
+        self.attached: bool = False
+        self.update(*args, **kwargs)
+
+    def update(self, backend: str = None, device: str = None) -> None:
+        previous = (getattr(self, '_backend', None),
+                    getattr(self, '_device', None))
+        self.backend: str = backend
+        self.device: str = device
+        if self.source is None or (self.backend, self.device) == previous:
+            return
+        try:
+            self.create()
+        except ValueError:
+            # the current source keeps running
+            self._backend, self._device = previous
+            raise
+
+    def create(self) -> None:
+        running = self.source is not None and self.source.is_alive()
+        # nothing is stopped if it cannot be created
+        source = self._get_source()
+        if self.source is not None:
+            self.source.stop()
+        self.source, self.on_move_source = source, source.on_move
+        self.on_click_source = source.on_click
+        self._set_callbacks()
+        if running:
+            self.source.start()
+
+    def _get_source(self) -> Source:
+        kwargs = {'on_move': self.on_move, 'on_click': self.on_click,
+                  'daemon': True}
+        if self.factory is not None:
+            return self.factory(**kwargs)
+        if self.backend == 'pynput':
+            return PynputListener(**kwargs)
+        try:
+            from .evdev import Listener as EvdevListener
+            return EvdevListener(device=self.device, latency=self.latency,
+                                 **kwargs)
+        except (ImportError, OSError) as exception:
+            raise ValueError(LISTENER_ERROR_BACKEND) from exception
+
+    # every event the source passes on is recorded first, None stops the
+    # recording
+    def record(self, recorder: Recorder) -> None:
+        if recorder is not None:
+            recorder.on_move_next = self.on_move
+            recorder.on_click_next = self.on_click
+        self.recorder = recorder
+        if self.source is not None:
+            self._set_callbacks()
+
+    def _set_callbacks(self) -> None:
+        recorder = self.recorder
+        self.on_move_attached = (self.on_move_source if recorder is None
+                                 else recorder.on_move)
+        self.source.on_click = (self.on_click_source if recorder is None
+                                else recorder.on_click)
+        self.source.on_move = (self.on_move_attached if self.attached
+                               else return_none)
+
+    # the source calls on_move for every pointer motion, while detached it
+    # is a no-op
+    def attach(self) -> None:
+        self.attached = True
+        self.source.on_move = self.on_move_attached
+
+    def detach(self) -> None:
+        self.attached = False
+        self.source.on_move = return_none
+
+    @property
+    def backend(self) -> str: return self._backend
+
+    @property
+    def device(self) -> str: return self._device
+
+    @backend.setter
+    def backend(self, value: str) -> None:
+        previous = getattr(self, '_backend', None)
+        self._set('_backend', LISTENER_BACKEND, value, str)
+        if self.backend not in LISTENER_BACKENDS:
+            value, self._backend = self.backend, previous or LISTENER_BACKEND
+            raise ValueError(f'unknown listener backend {value}, '
+                             f'it should be one of {LISTENER_BACKENDS}')
+
+    @device.setter
+    def device(self, value: str) -> None:
+        self._set('_device', LISTENER_DEVICE, value, str)
+
+    def json(self) -> Dict[str, Any]:
+        return {'backend': self.backend, 'device': self.device,
+                'attached': self.attached,
+                'recording': self.recorder is not None}
+
+
+class Profiles(Base):
+    """
+    scrolling options by window class, the window under the pointer is
+    tracked by windows.Windows while enabled
+
+    every profile is a window class followed by option=value pairs, or only
+    the option for euclidean and independent, e.g.
+    ('firefox', 'speed=600', 'euclidean'), parsed into scrolling options
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        # windows.Windows, imported once enabled
+        self.windows: Any = None
+        # scrolling options by lowercase window class
+        self.options: Dict[str, Dict[str, Any]] = {}
+        self.update(*args, **kwargs)
+
+    def update(self, enable: Union[bool, str] = None,
+               window: Iterable[Iterable[str]] = None) -> None:
+        self.window: Tuple[Tuple[str, ...], ...] = window
+        self.enable: bool = enable
+
+    # instance and class name of the window under the pointer, read without
+    # waiting for the x server
+    def get_classes(self) -> Tuple[str, ...]:
+        return self.windows.classes if self.windows is not None else ()
+
+    def get_options(self) -> Dict[str, Dict[str, Any]]:
+        return self.options if self.enable else {}
+
+    def close(self) -> None:
+        if self.windows is not None:
+            self.windows.stop()
+            self.windows = None
+
+    @staticmethod
+    def _parse_window(window: Tuple[str, ...]) -> Dict[str, Any]:
+        options = {}
+        for option in window[1:]:
+            name, separator, value = option.partition('=')
+            if name not in PROFILES_OPTIONS:
+                raise ValueError(f'{PROFILES_ERROR_WINDOW}, got {option}')
+            name = name.replace('-', '_')
+            if name in ('euclidean', 'independent'):
+                options[name] = convert_bool(value) if separator else True
+            elif name == 'function':
+                if value not in SCROLLING_FUNCTIONS:
+                    raise ValueError(f'unknown scrolling function {value}, '
+                                     f'it should be one of '
+                                     f'{SCROLLING_FUNCTIONS}')
+                options[name] = value
+            elif name == 'points':
+                parse_points(value)
+                options[name] = value
+            else:
+                options[name] = int(value)
+        return options
+
+    @property
+    def enable(self) -> bool: return self._enable
+
+    @property
+    def window(self) -> Tuple[Tuple[str, ...], ...]: return self._window
+
+    @enable.setter
+    def enable(self, value: Union[bool, str]) -> None:
+        self._set('_enable', PROFILES_ENABLE, value, (bool, str),
+                  convert_bool)
+        if not self.enable:
+            self.close()
+        elif self.windows is None:
+            try:
+                from .windows import Windows
+                self.windows = Windows()
+            except (ImportError, OSError) as exception:
+                self._enable = False
+                raise ValueError(PROFILES_ERROR_ENABLE) from exception
+            self.windows.start()
+
+    @window.setter
+    def window(self, value: Iterable[Iterable[str]]) -> None:
+        previous = getattr(self, '_window', None)
+        self._set('_window', PROFILES_WINDOW, value, (list, tuple),
+                  lambda windows: tuple(map(tuple, windows)))
+        # every profile is checked before any of them is used
+        options = {}
+        try:
+            for window in self.window:
+                if len(window) < 2:
+                    raise ValueError(f'{PROFILES_ERROR_WINDOW}, got '
+                                     f'{" ".join(window)}')
+                options[window[0].lower()] = self._parse_window(window)
+        except ValueError:
+            self._window = previous or PROFILES_WINDOW
+            raise
+        self.options = options
+
+    def json(self) -> Dict[str, Any]:
+        return {'enable': self.enable,
+                'window': [' '.join(window) for window in self.window],
+                'classes': self.get_classes()}
+
+
+class Scheduler(Base):
+    """
+    deadline-based tick scheduler on the monotonic clock
+
+    every deadline is the previous one plus the current interval, so time
+    spent scrolling and sleep overshoot do not add up, missed ticks are
+    returned to be scrolled at once
+    """
+
+    def __init__(self) -> None:
+        # the loop the scroll coroutine runs on and what it is waiting for,
+        # wake can be called from any thread
+        self.loop: AbstractEventLoop = None
+        self.waiter: Future = None
+        # deadline of the last tick, the interval of the current wait and
+        # the interval of the last tick, in seconds
+        self.deadline: int = 0
+        self.waiting: float = 0
+        self.interval: float = 0
+        # how late the last tick was, in nanoseconds
+        self.late: int = 0
+        self.reset()
+
+    def reset(self) -> None:
+        self.deadline = monotonic_ns()
+        self.ticks: int = 0
+        self.missed: int = 0
+        self.dropped: int = 0
+        self.late_total: int = 0
+        self.late_max: int = 0
+
+    def wake(self) -> None:
+        # the waiter is only touched in the loop, a wake that arrives while
+        # nothing is waiting is dropped, everything is checked again before
+        # the next wait anyway
+        try:
+            if self.loop is not None:
+                self.loop.call_soon_threadsafe(self._wake)
+        except RuntimeError:
+            # the loop has been closed
+            pass
+
+    def _wake(self) -> None:
+        if self.waiter is not None and not self.waiter.done():
+            self.waiter.set_result(None)
+
+    async def _sleep(self, timeout: float = None) -> None:
+        # untill the timeout or a wake call, whichever comes first
+        self.loop = get_running_loop()
+        self.waiter = self.loop.create_future()
+        handle = (self.loop.call_later(timeout, self._wake)
+                  if timeout is not None else None)
+        try:
+            await self.waiter
+        finally:
+            self.waiter = None
+            if handle is not None:
+                handle.cancel()
+
+    async def park(self, is_active: Callable[[], bool],
+                   get_timeout: Callable[[], float] = return_none) -> None:
+        if is_active():
+            return
+        # without a timeout, nothing runs untill something calls wake
+        while not is_active():
+            await self._sleep(get_timeout())
+        self.deadline = monotonic_ns()
+
+    async def wait(self, get_interval: Callable[[], float],
+                   is_active: Callable[[], bool]) -> int:
+        # returns 0 once is_active is false
+        while True:
+            if not is_active():
+                self.waiting = 0
+                return 0
+            self.waiting = get_interval()
+            interval = int(self.waiting * 1e9) or 1
+            deadline = self.deadline + interval
+            now = monotonic_ns()
+            if now >= deadline:
+                break
+            await self._sleep((deadline - now) / 1e9)
+        self.interval, self.waiting = self.waiting, 0
+        late = now - deadline
+        ticks = 1 + late // interval
+        if ticks > SCROLLING_CATCH_UP:
+            self.dropped += ticks - SCROLLING_CATCH_UP
+            ticks = SCROLLING_CATCH_UP
+            self.deadline = now
+        else:
+            self.deadline = deadline + (ticks - 1) * interval
+        self.ticks += 1
+        self.missed += ticks - 1
+        self.late = late
+        self.late_total += late
+        self.late_max = max(self.late_max, late)
+        return ticks
+
+    def json(self) -> Dict[str, Any]:
+        late_average = self.late_total / (self.ticks or 1)
+        return {'ticks': self.ticks, 'missed': self.missed,
+                'dropped': self.dropped,
+                'late average': f'{late_average / 1e3:.0f}us',
+                'late max': f'{self.late_max / 1e3:.0f}us'}
+
+
 class Scrolling(Base):
 
     def __init__(self, *args, **kwargs) -> None:
-        self.sleep_interval: int = SCROLLING_SLEEP_INTERVAL_INITIAL
-        self.controller: Controller = Controller()
-        self.coordinates: Coordinates = Coordinates()
-        self.coordinates.debug_keys_ignore = ['direction']
-        self.direction: Coordinates = Coordinates(name='direction')
-        self.direction.debug_keys_only = ['direction']
+        # created by the backend setter
+        self.controller: Sink = None
+        # the controller takes fractions of a unit
+        self.fractional: bool = False
+        self.motion: Motion = Motion()
+        self.scheduler: Scheduler = Scheduler()
+        # ticks that are due and seconds every tick stands for
+        self.ticks: int = 1
+        self.tick: float = SCROLLING_SLEEP_INTERVAL_INITIAL
+        # tick-rate mode: fractional units that have not been scrolled yet
+        self.remainder_x: float = 0
+        self.remainder_y: float = 0
+        # lazy mode: the latest pointer position written by the listener
+        # and the last one applied by the scroll loop
+        self.position: Tuple[int, int] = (0, 0)
+        self.position_applied: Tuple[int, int] = self.position
+        # options of every profile by window class, their motion
+        # configurations and the one of the current options, see use_profile
+        self.profiles: Dict[str, Dict[str, Any]] = {}
+        self.configurations: Dict[str, MotionConfiguration] = {}
+        self.configuration: MotionConfiguration = None
+        self.profile: str = None
 
         self.event_end: Event = Event()
         self.event_scrolling: Event = Event()
@@ -361,25 +702,147 @@ class Scrolling(Base):
 
     def update(self, dead_area: Union[str, int] = None,
                speed: Union[str, int] = None,
-               acceleration: Union[str, int] = None) -> None:
-        self.speed: int = speed
-        self.dead_area: int = dead_area
-        self.acceleration: int = acceleration
+               acceleration: Union[str, int] = None,
+               tick_rate: Union[str, int] = None,
+               lazy: Union[str, bool] = None,
+               backend: str = None,
+               function: str = None,
+               points: str = None,
+               euclidean: Union[str, bool] = None,
+               independent: Union[str, bool] = None) -> None:
+        # every option is checked and every curve built before the motion
+        # is configured with them, nothing changes if any of them is
+        # rejected
+        previous = self._get_arguments()
+        try:
+            self.speed: int = speed
+            self.dead_area: int = dead_area
+            self.acceleration: int = acceleration
+            self.tick_rate: int = tick_rate
+            self.lazy: bool = lazy
+            self.function: str = function
+            self.points: str = points
+            self.euclidean: bool = euclidean
+            self.independent: bool = independent
+            configurations = self._get_configurations(self.profiles)
+            # last, a controller is only created once the rest is accepted
+            self.backend: str = backend
+        except Exception:
+            for name, value in previous.items():
+                setattr(self, name, value)
+            raise
+        self._configure(self.profiles, *configurations)
+
+    # the curves are precomputed, motion only looks the interval up,
+    # profiles only change the options they set, nothing changes if a curve
+    # cannot be built
+    def set_profiles(self, profiles: Dict[str, Dict[str, Any]]) -> None:
+        self._configure(profiles, *self._get_configurations(profiles))
+
+    def _get_configurations(self, profiles: Dict[str, Dict[str, Any]]) \
+            -> Tuple[MotionConfiguration, Dict[str, MotionConfiguration]]:
+        return (self._get_configuration({}),
+                {name: self._get_configuration(options)
+                 for name, options in profiles.items()})
+
+    def _configure(self, profiles: Dict[str, Dict[str, Any]],
+                   configuration: MotionConfiguration,
+                   configurations: Dict[str, MotionConfiguration]) -> None:
+        self.profiles, self.configurations = profiles, configurations
+        self.configuration = configuration
+        if self.profile not in configurations:
+            self.profile = None
+        self.motion.configure(*configurations.get(self.profile,
+                                                  configuration))
+
+    def _get_configuration(self,
+                           options: Dict[str, Any]) -> MotionConfiguration:
+        points = (parse_points(options['points']) if 'points' in options
+                  else self.curve_points)
+        table = build_table(options.get('function', self.function),
+                            options.get('speed', self.speed),
+                            options.get('acceleration', self.acceleration),
+                            points)
+        return (options.get('dead_area', self.dead_area), table,
+                options.get('euclidean', self.euclidean),
+                options.get('independent', self.independent))
+
+    # called when the scrolling starts, the first class with a profile
+    # picks it, none of them the current options
+    def use_profile(self, classes: Tuple[str, ...]) -> None:
+        profile = None
+        for name in classes:
+            if name in self.configurations:
+                profile = name
+                break
+        if profile != self.profile:
+            self.profile = profile
+            self.motion.configure(*self.configurations.get(
+                profile, self.configuration))
+
+    @property
+    def sleep_interval(self) -> float: return self.motion.interval
+
+    def tick_interval(self) -> float:
+        # with a tick rate, ticks are never shorter than 1 / tick rate
+        return max(self.motion.interval, 1 / self.tick_rate) \
+            if self.tick_rate else self.motion.interval
+
+    async def sleep_for_interval(self) -> None:
+        self.ticks = await self.scheduler.wait(self.tick_interval,
+                                               self.is_active)
+        self.tick = self.scheduler.interval
 
-    def sleep_for_interval(self) -> None: sleep(self.sleep_interval)
+    # parked while not scrolling or inside the dead area, in lazy mode
+    # the position is checked every interval inside the dead area
+    async def wait(self) -> None:
+        await self.scheduler.park(self.is_active, self.poll)
 
-    def wait(self) -> None: self.event_scrolling.wait()
+    def poll(self) -> float:
+        return self.motion.interval \
+            if self.lazy and self.event_scrolling.is_set() else None
 
     def scroll_once(self) -> None:
-        self.controller.scroll(*self.direction.current)
+        # the scrolling has stopped while sleeping
+        if not self.ticks:
+            return
+        motion = self.motion
+        if not self.tick_rate and not motion.independent:
+            return self.controller.scroll(motion.direction_x * self.ticks,
+                                          motion.direction_y * self.ticks)
+        # the same number of units per second as 1 unit every interval,
+        # sent in as few scroll calls as possible, every axis has its own
+        # remainder
+        units = self.ticks * self.tick / motion.interval
+        units_x = motion.direction_x * motion.share_x * units
+        units_y = motion.direction_y * motion.share_y * units
+        if self.fractional:
+            return self.controller.scroll(units_x, units_y)
+        self.remainder_x += units_x
+        self.remainder_y += units_y
+        x, y = int(self.remainder_x), int(self.remainder_y)
+        self.remainder_x -= x
+        self.remainder_y -= y
+        if x or y:
+            self.controller.scroll(x, y)
+
+    # the uinput device is removed, pynput has nothing to close
+    def close(self) -> None: getattr(self.controller, 'close', return_none)()
+
+    def clear_remainder(self) -> None:
+        self.remainder_x, self.remainder_y = 0, 0
 
     def start(self) -> None:
+        self.clear_remainder()
+        self.scheduler.reset()
         self.event_started.set()
         self.event_scrolling.set()
+        self.scheduler.wake()
 
     def stop(self) -> None:
         self.event_scrolling.clear()
         self.event_ended.set()
+        self.scheduler.wake()
 
     def clear_started_and_ended(self) -> None:
         self.event_ended.clear()
@@ -387,39 +850,71 @@ class Scrolling(Base):
 
     def is_scrolling(self) -> bool: return self.event_scrolling.is_set()
 
+    def is_active(self) -> bool:
+        if self.lazy:
+            self.apply_position()
+        return self.event_scrolling.is_set() and bool(
+            self.motion.direction_x or self.motion.direction_y)
+
     def has_started(self) -> bool: return self.event_started.is_set()
 
     def has_ended(self) -> bool: return self.event_ended.is_set()
 
     def is_not_end(self) -> bool: return not self.event_end.is_set()
 
-    def is_dead_area(self) -> bool:
-        distance = self.coordinates.distance(absolute=True)
-        return distance[0] <= self.dead_area and distance[1] <= self.dead_area
+    def is_dead_area(self) -> bool: return self.motion.is_dead_area()
 
-    def set_interval(self) -> None:
-        distance = self.coordinates.distance(absolute=True)
-        interval = self.acceleration * max(distance) + self.speed
-        self.sleep_interval = abs(100 / interval) \
-            if interval else SCROLLING_SLEEP_INTERVAL_INITIAL
+    def get_direction(self) -> Tuple[int, int]:
+        return self.motion.direction_x, self.motion.direction_y
 
     def set_initial_coordinates(self, x: int, y: int) -> None:
-        self.coordinates.initial = x, y
-
-    def set_direction_and_coordinates(self, x: int, y: int) -> None:
-        self.coordinates.update(x, y)
-        self.direction.current = ((0, 0) if self.is_dead_area()
-                                  else self.coordinates.direction())
+        self.motion.start(x, y)
+
+    # lazy mode: computes direction and interval for the latest position,
+    # once per tick instead of once per motion event
+    def apply_position(self) -> None:
+        position = self.position
+        if position is not self.position_applied:
+            self.position_applied = position
+            self.motion.move(*position)
+
+    # moves at once, the latest position is not applied later
+    def set_position(self, x: int, y: int) -> None:
+        self.position = self.position_applied = x, y
+        self.move(x, y)
+
+    # updates coordinates, direction and interval in one go
+    def move(self, x: int, y: int) -> None:
+        motion = self.motion
+        direction_x, direction_y = motion.direction_x, motion.direction_y
+        motion.move(x, y)
+        if not self.event_scrolling.is_set():
+            return
+        # wake the scroll loop if it is parked in the dead area or
+        # sleeping for an outdated interval
+        if (direction_x != motion.direction_x
+                or direction_y != motion.direction_y
+                or motion.interval < self.scheduler.waiting
+                * SCROLLING_WAKE_RATIO):
+            self.scheduler.wake()
 
     def json(self) -> str:
         return {'active': self.is_scrolling(),
                 'interval': self.sleep_interval,
+                'speed': self.speed,
                 'acceleration': self.acceleration,
                 'dead_area': self.dead_area,
+                'function': self.function,
+                'points': self.points,
+                'euclidean': self.euclidean,
+                'independent': self.independent,
+                'profile': self.profile,
+                'tick_rate': self.tick_rate,
+                'lazy': self.lazy,
+                'backend': self.backend,
                 'started': self.has_started(),
                 'ended': self.has_ended(),
-                'coordinates': self.coordinates,
-                'direction': self.direction}
+                'motion': self.motion}
 
     @property
     def speed(self) -> int: return self._speed
@@ -430,6 +925,27 @@ class Scrolling(Base):
     @property
     def acceleration(self) -> int: return self._acceleration
 
+    @property
+    def tick_rate(self) -> int: return self._tick_rate
+
+    @property
+    def lazy(self) -> bool: return self._lazy
+
+    @property
+    def backend(self) -> str: return self._backend
+
+    @property
+    def function(self) -> str: return self._function
+
+    @property
+    def points(self) -> str: return self._points
+
+    @property
+    def euclidean(self) -> bool: return self._euclidean
+
+    @property
+    def independent(self) -> bool: return self._independent
+
     @speed.setter
     def speed(self, value: Union[str, int] = None) -> None:
         self._set('_speed', SCROLLING_SPEED, value, (str, int), int)
@@ -443,13 +959,94 @@ class Scrolling(Base):
         self._set('_acceleration', SCROLLING_ACCELERATION_DISTANCE, value,
                   (str, int), int)
 
+    @backend.setter
+    def backend(self, value: str) -> None:
+        previous = getattr(self, '_backend', None)
+        self._set('_backend', SCROLLING_BACKEND, value, str)
+        if self.backend not in SCROLLING_BACKENDS:
+            value, self._backend = self.backend, previous or SCROLLING_BACKEND
+            raise ValueError(f'unknown scrolling backend {value}, '
+                             f'it should be one of {SCROLLING_BACKENDS}')
+        if self.backend == previous and self.controller is not None:
+            return
+        try:
+            self.controller = self._get_controller(self.backend)
+        except ValueError:
+            self._backend = previous or SCROLLING_BACKEND
+            raise
+        self.fractional = getattr(self.controller, 'fractional', False)
+
+    @staticmethod
+    def _get_controller(backend: str) -> Sink:
+        if backend == 'pynput':
+            return Controller()
+        if backend == 'recording':
+            return RecordingSink()
+        try:
+            from .uinput import Controller as UinputController
+            return UinputController()
+        except (ImportError, OSError) as exception:
+            raise ValueError(SCROLLING_ERROR_BACKEND) from exception
+
+    @function.setter
+    def function(self, value: str) -> None:
+        previous = getattr(self, '_function', None)
+        self._set('_function', SCROLLING_FUNCTION, value, str)
+        if self.function not in SCROLLING_FUNCTIONS:
+            value = self.function
+            self._function = previous or SCROLLING_FUNCTION
+            raise ValueError(f'unknown scrolling function {value}, '
+                             f'it should be one of {SCROLLING_FUNCTIONS}')
+
+    @points.setter
+    def points(self, value: str) -> None:
+        previous = getattr(self, '_points', None)
+        self._set('_points', SCROLLING_POINTS, value, str)
+        try:
+            self.curve_points: Points = parse_points(self.points)
+        except ValueError:
+            self._points = previous or SCROLLING_POINTS
+            raise
+
+    @euclidean.setter
+    def euclidean(self, value: Union[str, bool]) -> None:
+        self._set('_euclidean', SCROLLING_EUCLIDEAN, value, (str, bool),
+                  convert_bool)
+
+    @independent.setter
+    def independent(self, value: Union[str, bool]) -> None:
+        self._set('_independent', SCROLLING_INDEPENDENT, value, (str, bool),
+                  convert_bool)
+
+    @lazy.setter
+    def lazy(self, value: Union[str, bool]) -> None:
+        self._set('_lazy', SCROLLING_LAZY, value, (str, bool), convert_bool)
+
+    @tick_rate.setter
+    def tick_rate(self, value: Union[str, int]) -> None:
+        previous = getattr(self, '_tick_rate', None)
+        self._set('_tick_rate', SCROLLING_TICK_RATE, value, (str, int), int)
+        if self.tick_rate < 0:
+            value = self.tick_rate
+            self._tick_rate = SCROLLING_TICK_RATE if previous is None \
+                else previous
+            raise ValueError(f'tick rate should not be negative, it is {value}')
+
 
 class Icon(Base):
 
     def __init__(self, *args, **kwargs) -> None:
         self.application = None
+        self.lock: Lock = Lock()
+        # last show request made before the qt application started
+        self.pending: Tuple[int, int] = None
+        self._icon = None
+        self._icon_source: Tuple[str, int] = None
+        # set by Autoscroll, read by the icon once per frame
+        self.get_direction: Callable[[], Tuple[int, int]] = return_none
         self.event_icon_enabled: Event = Event()
         self.event_qt_application_started: Event = Event()
+        self.event_quit: Event = Event()
         self.update(*args, **kwargs)
 
     def update(self, enable: Union[str, bool] = None,
@@ -459,19 +1056,54 @@ class Icon(Base):
         self.enable: bool = enable
         self.icon: Union[None, object] = self.path, self.size
 
+    # called from the listener, it only queues the request for the qt
+    # thread, so it returns at once
     def show(self, x: int, y: int) -> None:
-        return self.icon.show(x, y) if self.enable else None
-
-    def hide(self) -> None: return self.icon.hide() if self.enable else None
+        if not self.enable:
+            return
+        # qt is still loading, the icon is shown once it is ready
+        with self.lock:
+            if self._icon is None:
+                self.pending = x, y
+                return
+        self._icon.request_show.emit(x, y)
+
+    def hide(self) -> None:
+        with self.lock:
+            self.pending = None
+        if self.enable and self._icon is not None:
+            self._icon.request_hide.emit()
 
     def json(self) -> Dict[str, Any]:
-        return {'enable': self.enable, 'path': self.path, 'size': self.size}
+        return {'enable': self.enable, 'path': self.path, 'size': self.size,
+                'loaded': self.event_qt_application_started.is_set()}
+
+    # from any thread, start_qt_when_icon_is_enabled returns
+    def quit(self) -> None:
+        with self.lock:
+            self.event_quit.set()
+            self.event_icon_enabled.set()
+            if self._icon is not None:
+                self._icon.request_quit.emit()
 
     def start_qt_when_icon_is_enabled(self) -> None:
+        # qt is imported and started only here, in the main thread, after
+        # everything else is running
         self.event_icon_enabled.wait()
-        self.application = self._get_qt(True)
-        self.event_qt_application_started.set()
-        self.application.exec()
+        if self.event_quit.is_set():
+            return
+        qt = self._get_qt()
+        self.application = qt.get_application()
+        with self.lock:
+            # quit while qt was loading
+            if self.event_quit.is_set():
+                return
+            self._create_icon(qt)
+            self.event_qt_application_started.set()
+            pending, self.pending = self.pending, None
+        if pending is not None:
+            self._icon.show(*pending)
+        qt.exec_application()
 
     @property
     def path(self) -> str: return self._path
@@ -495,43 +1127,69 @@ class Icon(Base):
 
     @enable.setter
     def enable(self, value: Union[str, bool]) -> None:
+        # qt is started by the icon setter, once there is an icon to show
         self._set('_enable', ICON_ENABLE, value, (str, bool), convert_bool)
-        if self.enable:
-            self.event_icon_enabled.set()
 
     @icon.setter
     def icon(self, value: Tuple[str, int]) -> None:
+        # the widget is created only once, in the qt thread, disabling the
+        # icon just hides it
         if not self.enable:
-            self._icon = None
-            return
-        self.event_qt_application_started.wait()
-        value = check_iterable(value)
-        if getattr(self, '_icon', None) is not None:
-            self.icon.update_icon(*value)
+            if self._icon is not None:
+                self._icon.request_hide.emit()
             return
-        self._icon = self._get_qt()(*value)
-        self.application.setActiveWindow(self.icon)
-
-    def _get_qt(self, get_application: bool = False) -> object:
+        value = tuple(check_iterable(value))
+        with self.lock:
+            # do not reload the image if neither path nor size have changed
+            if value == self._icon_source and self._icon is not None:
+                return
+            self._icon_source = value
+            # do not wait for qt, the icon is created once it has started,
+            # from the source set above
+            if self._icon is not None:
+                self._icon.request_update.emit(*value)
+        self.event_icon_enabled.set()
+
+    def _create_icon(self, qt: object) -> None:
+        self._icon = qt.Icon(*self._icon_source, self.get_direction)
+        self.application.setActiveWindow(self._icon)
+
+    def _get_qt(self) -> object:
         try:
-            from .qt import Icon as qt_icon, application
+            from . import qt
         except ImportError as exception:
             raise ValueError(ICON_ERROR) from exception
-        return application if get_application else qt_icon
+        return qt
 
 
 class Debug(Base):
 
+    def __init__(self, *args, **kwargs) -> None:
+        # clicks and scrolling are traced instead of printed, they happen
+        # on the listener and scroll threads
+        self.tracer: Tracer = Tracer()
+        # input events are recorded on the listener thread, see
+        # Listener.record
+        self.recorder: Recorder = Recorder()
+        self.update(*args, **kwargs)
+
     def update(self, scroll: bool = None, file: bool = None,
-               click: bool = None, initial: bool = None) -> None:
+               click: bool = None, initial: bool = None,
+               jitter: bool = None, trace: str = None,
+               record: str = None) -> None:
         self.scroll: bool = scroll
         self.click: bool = click
         self.initial: bool = initial
         self.file: bool = file
+        self.jitter: bool = jitter
+        self.trace: str = trace
+        self.record: str = record
 
     def json(self) -> Dict[str, Any]:
         return {'scroll': self.scroll, 'click': self.click,
-                'initial': self.initial, 'file': self.file}
+                'initial': self.initial, 'file': self.file,
+                'jitter': self.jitter, 'trace': self.trace,
+                'record': self.record, 'lost': self.tracer.lost}
 
     @property
     def scroll(self) -> bool: return self._scroll
@@ -545,13 +1203,34 @@ class Debug(Base):
     @property
     def file(self) -> bool: return self._file
 
+    @property
+    def jitter(self) -> bool: return self._jitter
+
+    @property
+    def trace(self) -> str: return self._trace
+
+    @property
+    def record(self) -> str: return self._record
+
     @scroll.setter
     def scroll(self, value: bool) -> None:
         self._set('_scroll', DEBUG_SCROLL, value, (str, bool), convert_bool)
+        # the buffer exists before the listener and the scroll loop record
+        # into it
+        if self.scroll:
+            self.tracer.enable()
+        self.tracer.scroll = self.scroll
+        self.tracer.set_writer()
 
     @click.setter
     def click(self, value: bool) -> None:
         self._set('_click', DEBUG_CLICK, value, (str, bool), convert_bool)
+        # the buffer exists before the listener and the scroll loop record
+        # into it
+        if self.click:
+            self.tracer.enable()
+        self.tracer.click = self.click
+        self.tracer.set_writer()
 
     @initial.setter
     def initial(self, value: bool) -> None:
@@ -561,17 +1240,44 @@ class Debug(Base):
     def file(self, value: bool) -> None:
         self._set('_file', DEBUG_FILE, value, (str, bool), convert_bool)
 
+    @jitter.setter
+    def jitter(self, value: bool) -> None:
+        self._set('_jitter', DEBUG_JITTER, value, (str, bool), convert_bool)
+
+    @trace.setter
+    def trace(self, value: str) -> None:
+        self._set('_trace', DEBUG_TRACE, value, str)
+        self.tracer.path = self.trace or None
+
+    @record.setter
+    def record(self, value: str) -> None:
+        previous = getattr(self, '_record', None)
+        self._set('_record', DEBUG_RECORD, value, str)
+        if self.record == previous:
+            return
+        if not self.record:
+            self.recorder.close()
+            return
+        try:
+            self.recorder.open(self.record)
+        except OSError as exception:
+            self._record = DEBUG_RECORD
+            raise ValueError(f'{DEBUG_ERROR_RECORD}, path - '
+                             f'{value}') from exception
+
 
 class Config(Base):
 
     debug_keys_ignore = 'content'
+    # built on first use, shared by every instance, the second one raises
+    # ArgumentError instead of exiting
+    _argument_parser: ArgparseParser = None
+    _argument_parser_raising: ArgparseParser = None
 
     def __init__(self, *args, **kwargs) -> None:
-        self._stamp: int = 0
-        self.event_enabled: Event = Event()
+        self._stamp: Tuple[int, int, int] = None
+        self.watcher: Watcher = None
         self._parse_config_file_content: Dict[str, Any] = {}
-        self.argument_parser: ArgparseParser = ArgparseParser(
-            **PARSER_INITIALIZER).add_arguments(**ARGUMENTS)
         self.update(*args, **kwargs)
 
     def update(self, enable: Union[bool, str] = None,
@@ -580,36 +1286,90 @@ class Config(Base):
         self.enable: bool = enable
         self.interval: int = interval
 
-    def wait(self) -> None: self.event_enabled.wait()
+    async def wait_for_change(self) -> None:
+        # on linux, returns within milliseconds of a write, otherwise
+        # (or if inotify is not available) polls every interval
+        watcher = self._get_watcher()
+        if watcher is None:
+            await asyncio_sleep(self.interval)
+            return
+        await watcher.wait(self.interval)
+
+    def _get_watcher(self) -> Watcher:
+        if self.watcher is not None and self.watcher.path == self.path:
+            return self.watcher
+        if self.watcher is not None:
+            self.watcher.close()
+        try:
+            self.watcher = Watcher(self.path)
+        except OSError:
+            self.watcher = None
+        return self.watcher
 
     def parse_argv(self) -> Dict[str, Any]: return self._parse()
 
-    def parse_string(self, value: str) -> Dict[str, Any]:
-        return self._parse(value.split())
+    def parse_string(self, value: str,
+                     exit_on_error: bool = True) -> Dict[str, Any]:
+        return self._parse(value.split(), exit_on_error=exit_on_error)
+
+    def apply_config_file(self, update: Callable[..., None]) -> None:
+        # only the arguments that have changed since they were last
+        # applied, the content is kept once update has accepted them, a file
+        # that cannot be parsed or applied raises and is not read again
+        # until it changes, see forget_config_file
+        content = self._parse_config_file()
+        if not content:
+            return
+        changes = diff_arguments(self._parse_config_file_content, content)
+        if changes:
+            update(**changes)
+        self._parse_config_file_content = content
 
-    def parse_config_file(self) -> Dict[str, Any]:
-        self._parse_config_file_content = self._parse_config_file()
-        return self._parse_config_file_content
+    # every update forgets what was applied from the file, the options may
+    # have been changed from somewhere else (the control socket), so the
+    # whole file is applied the next time it changes
+    def forget_config_file(self) -> None:
+        self._parse_config_file_content = {}
 
     def _parse_config_file(self) -> Dict[str, Any]:
         if not self._has_file_changed():
             return {}
         with open(self.path, 'r') as config_file:
             config = config_file.read()
-        result = self.parse_string(config.replace('\n', ' '))
-        return result
+        return self.parse_string(config.replace('\n', ' '),
+                                 exit_on_error=False)
 
-    def _parse(self, *args, **kwargs) -> Dict[str, Any]:
-        return parse_arguments(**vars(
-            self.argument_parser.parse_args(*args, **kwargs)))
+    def _parse(self, *args, exit_on_error: bool = True,
+               **kwargs) -> Dict[str, Any]:
+        parser = (self.argument_parser if exit_on_error
+                  else self.argument_parser_raising)
+        return parse_arguments(**vars(parser.parse_args(*args, **kwargs)))
 
     def _has_file_changed(self) -> bool:
-        stamp = os_stat(self.path).st_mtime
+        # inode and size catch atomic renames and writes within the same
+        # mtime tick
+        stat = os_stat(self.path)
+        stamp = stat.st_mtime_ns, stat.st_ino, stat.st_size
         if stamp == self._stamp:
             return False
         self._stamp = stamp
         return True
 
+    @property
+    def argument_parser(self) -> ArgparseParser:
+        if Config._argument_parser is None:
+            Config._argument_parser = ArgparseParser(
+                **PARSER_INITIALIZER).add_arguments(**ARGUMENTS)
+        return Config._argument_parser
+
+    @property
+    def argument_parser_raising(self) -> ArgparseParser:
+        if Config._argument_parser_raising is None:
+            Config._argument_parser_raising = ArgparseParser(
+                **PARSER_INITIALIZER,
+                exit_on_error=False).add_arguments(**ARGUMENTS)
+        return Config._argument_parser_raising
+
     @property
     def enable(self) -> bool: return self._enable
 
@@ -625,8 +1385,6 @@ class Config(Base):
         if self.enable and not self.path:
             self.enable = False
             raise ValueError(f'{CONFIG_ERROR_ENABLE}, path - {self.path}')
-        if self.enable and not self.event_enabled.is_set():
-            self.event_enabled.set()
 
     @interval.setter
     def interval(self, value: Union[str, int]) -> None:
@@ -640,3 +1398,114 @@ class Config(Base):
         return {'path': self.path, 'enable': self.enable,
                 'interval': self.interval,
                 'content': self._parse_config_file_content}
+
+
+class Metrics(Base):
+
+    def __init__(self, *args, **kwargs) -> None:
+        # collected whether or not they are written anywhere
+        self.collector: Collector = Collector()
+        self.update(*args, **kwargs)
+
+    def update(self, enable: Union[bool, str] = None, path: str = None,
+               interval: Union[str, int] = None) -> None:
+        self.path: str = path
+        self.enable: bool = enable
+        self.interval: int = interval
+
+    def write(self) -> None:
+        # prometheus text format, replaced at once so that a collector
+        # never reads half a file
+        if not self.enable:
+            return
+        os_makedirs(os_path_dirname(self.path) or '.', exist_ok=True)
+        path_temporary = f'{self.path}.tmp'
+        with open(path_temporary, 'w') as metrics_file:
+            metrics_file.write(self.collector.prometheus())
+        os_replace(path_temporary, self.path)
+
+    async def wait_for_interval(self) -> None:
+        await asyncio_sleep(self.interval)
+
+    @property
+    def enable(self) -> bool: return self._enable
+
+    @property
+    def path(self) -> str: return self._path
+
+    @property
+    def interval(self) -> int: return self._interval
+
+    @enable.setter
+    def enable(self, value: Union[bool, str]) -> None:
+        self._set('_enable', METRICS_ENABLE, value, (bool, str), convert_bool)
+
+    @interval.setter
+    def interval(self, value: Union[str, int]) -> None:
+        previous = getattr(self, '_interval', None)
+        self._set('_interval', METRICS_INTERVAL, value, (int, str), int)
+        if self.interval <= 0:
+            value = self.interval
+            self._interval = METRICS_INTERVAL if previous is None \
+                else previous
+            raise ValueError(f'{METRICS_ERROR_INTERVAL}, interval - {value}')
+
+    @path.setter
+    def path(self, value: str) -> None:
+        self._set('_path', METRICS_PATH, value, str)
+
+    def json(self) -> Dict[str, Any]:
+        return {'enable': self.enable, 'path': self.path,
+                'interval': self.interval, **self.collector.json()}
+
+
+class Remote(Base):
+
+    def __init__(self, *args, **kwargs) -> None:
+        self.server: Server = None
+        self.update(*args, **kwargs)
+
+    def update(self, enable: Union[bool, str] = None,
+               path: str = None) -> None:
+        self.path: str = path
+        self.enable: bool = enable
+
+    async def serve(self, handle: Callable[[str], str]) -> None:
+        # returns once the socket is closed, when the path changes or the
+        # control socket is disabled
+        self.server = server = Server(self.path, handle)
+        try:
+            await server.start()
+        except OSError as exception:
+            self.server = None
+            self.enable = False
+            raise ValueError(f'{REMOTE_ERROR_ENABLE}, path - {self.path}, '
+                             f'{exception}') from exception
+        await server.wait_closed()
+
+    def close(self) -> None:
+        if self.server is not None:
+            self.server.close()
+            self.server = None
+
+    @property
+    def enable(self) -> bool: return self._enable
+
+    @property
+    def path(self) -> str: return self._path
+
+    @enable.setter
+    def enable(self, value: Union[bool, str]) -> None:
+        self._set('_enable', REMOTE_ENABLE, value, (bool, str), convert_bool)
+        if not self.enable:
+            self.close()
+
+    @path.setter
+    def path(self, value: str) -> None:
+        path = getattr(self, '_path', None)
+        self._set('_path', REMOTE_PATH, value, str)
+        if path is not None and path != self.path:
+            self.close()
+
+    def json(self) -> Dict[str, Any]:
+        return {'enable': self.enable, 'path': self.path}
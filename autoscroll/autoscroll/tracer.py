@@ -0,0 +1,114 @@
+from atexit import register as atexit_register
+from itertools import count
+from json import dumps
+from sys import stdout as sys_stdout
+from threading import Event, Lock, Thread
+from time import monotonic_ns, sleep
+from typing import Dict, Iterator, List, Tuple
+from pynput.mouse import Button
+from .constants import DEBUG_TRACE_INTERVAL, DEBUG_TRACE_SIZE
+
+# event kinds and the names of their fields
+MOVE: int = 1
+CLICK: int = 2
+TICK: int = 3
+EVENTS: Dict[int, Tuple[str, Tuple[str, ...]]] = {
+    MOVE: ('move', ('x', 'y')),
+    CLICK: ('click', ('x', 'y', 'button', 'pressed', 'scrolling')),
+    # the interval of a tick in microseconds
+    TICK: ('tick', ('ticks', 'x', 'y', 'interval'))}
+BUTTONS: Tuple[Button, ...] = tuple(Button)
+BUTTON_INDEXES: Dict[Button, int] = {button: index
+                                     for index, button in enumerate(BUTTONS)}
+
+
+class Tracer:
+    """
+    ring buffer of timestamped event tuples, recording one is a single
+    list store, formatting and writing happens in a background thread
+
+    every event is written as a json line, if the writer falls more than
+    a buffer behind, the oldest events are overwritten and counted as lost
+    """
+
+    def __init__(self, size: int = DEBUG_TRACE_SIZE) -> None:
+        self.size = size
+        # (index, time, kind, and up to 5 int fields)
+        self.ring: List[Tuple[int, ...]] = None
+        self.counter: Iterator[int] = count()
+        # the next event to be written
+        self.index: int = 0
+        self.lost: int = 0
+        # which events are recorded, set by Debug
+        self.scroll: bool = False
+        self.click: bool = False
+        self.path: str = None
+        self.lock: Lock = Lock()
+        self.thread: Thread = None
+        # set while scroll or click is, the writer is parked otherwise
+        self.event_recording: Event = Event()
+
+    def enable(self) -> None:
+        # the buffer and the writer are created on first use
+        if self.thread is not None:
+            return
+        self.ring = [None] * self.size
+        self.thread = Thread(target=self._write_periodically, daemon=True)
+        self.thread.start()
+        atexit_register(self.flush)
+
+    # called once scroll or click has changed
+    def set_writer(self) -> None:
+        if self.scroll or self.click:
+            self.event_recording.set()
+        else:
+            self.event_recording.clear()
+
+    def record(self, kind: int, a: int = 0, b: int = 0, c: int = 0,
+               d: int = 0, e: int = 0) -> None:
+        # next() on itertools.count and a list store are atomic, the
+        # listener and scroll threads never need a lock
+        index = next(self.counter)
+        self.ring[index % self.size] = (index, monotonic_ns(), kind,
+                                        a, b, c, d, e)
+
+    def events(self) -> Iterator[Dict[str, int]]:
+        # every event recorded since the last call, oldest first
+        ring = self.ring
+        while ring is not None:
+            item = ring[self.index % self.size]
+            if item is None or item[0] < self.index:
+                return
+            self.index += 1
+            # overwritten before it was written
+            if item[0] >= self.index:
+                self.lost += 1
+                continue
+            name, fields = EVENTS[item[2]]
+            event = {'time': item[1], 'event': name}
+            event.update(zip(fields, item[3:]))
+            if name == 'click':
+                event['button'] = BUTTONS[event['button']].name
+                event['pressed'] = bool(event['pressed'])
+                event['scrolling'] = bool(event['scrolling'])
+            yield event
+
+    def flush(self) -> None:
+        with self.lock:
+            lines = [dumps(event) + '\n' for event in self.events()]
+            if not lines:
+                return
+            if self.path is None:
+                sys_stdout.writelines(lines)
+                sys_stdout.flush()
+                return
+            with open(self.path, 'a') as output:
+                output.writelines(lines)
+
+    def _write_periodically(self) -> None:
+        # what was recorded before both were turned off is written once
+        # more before it is parked
+        while True:
+            self.event_recording.wait()
+            sleep(DEBUG_TRACE_INTERVAL)
+            self.flush()
@@ -0,0 +1,107 @@
+from fcntl import ioctl
+from os import O_NONBLOCK, O_WRONLY, close as os_close, open as os_open, write as os_write
+from struct import pack
+from .backends import Sink
+from .constants import SCROLLING_UINPUT_NAME, SCROLLING_UINPUT_PATH
+
+# linux/input-event-codes.h
+EV_SYN: int = 0x00
+EV_KEY: int = 0x01
+EV_REL: int = 0x02
+SYN_REPORT: int = 0
+BTN_LEFT: int = 0x110
+BTN_RIGHT: int = 0x111
+BTN_MIDDLE: int = 0x112
+REL_X: int = 0x00
+REL_Y: int = 0x01
+REL_HWHEEL: int = 0x06
+REL_WHEEL: int = 0x08
+REL_WHEEL_HI_RES: int = 0x0b
+REL_HWHEEL_HI_RES: int = 0x0c
+BUS_VIRTUAL: int = 0x06
+# a wheel notch in hi-res units
+NOTCH: int = 120
+
+# linux/uinput.h
+UI_DEV_CREATE: int = 0x5501
+UI_DEV_DESTROY: int = 0x5502
+UI_DEV_SETUP: int = 0x405c5503
+UI_SET_EVBIT: int = 0x40045564
+UI_SET_KEYBIT: int = 0x40045565
+UI_SET_RELBIT: int = 0x40045566
+
+# struct input_event, the time is filled in by the kernel
+INPUT_EVENT: str = 'llHHi'
+
+
+class Controller(Sink):
+    """
+    scrolls through a virtual uinput mouse with high-resolution wheel
+    events, linux only
+
+    unlike pynput, it takes fractions of a notch, one event carries the
+    whole delta, the legacy wheel events are sent every full notch
+    """
+
+    fractional = True
+
+    def __init__(self, path: str = SCROLLING_UINPUT_PATH,
+                 name: str = SCROLLING_UINPUT_NAME) -> None:
+        self.fd = os_open(path, O_WRONLY | O_NONBLOCK)
+        # hi-res units that have not made a full notch yet
+        self.remainder_x = self.remainder_y = 0
+        try:
+            ioctl(self.fd, UI_SET_EVBIT, EV_KEY)
+            # libinput treats a device as a mouse only if it has buttons
+            for button in (BTN_LEFT, BTN_RIGHT, BTN_MIDDLE):
+                ioctl(self.fd, UI_SET_KEYBIT, button)
+            ioctl(self.fd, UI_SET_EVBIT, EV_REL)
+            for axis in (REL_X, REL_Y, REL_WHEEL, REL_HWHEEL,
+                         REL_WHEEL_HI_RES, REL_HWHEEL_HI_RES):
+                ioctl(self.fd, UI_SET_RELBIT, axis)
+            # struct uinput_setup: input_id, name, ff_effects_max
+            ioctl(self.fd, UI_DEV_SETUP,
+                  pack('HHHH80sI', BUS_VIRTUAL, 0, 0, 0,
+                       name.encode()[:79], 0))
+            ioctl(self.fd, UI_DEV_CREATE)
+        except OSError:
+            self.close()
+            raise
+
+    def scroll(self, dx: float, dy: float) -> None:
+        x, y = round(dx * NOTCH), round(dy * NOTCH)
+        events = []
+        if y:
+            events.append(pack(INPUT_EVENT, 0, 0, EV_REL, REL_WHEEL_HI_RES, y))
+            self.remainder_y, notches = self._notches(self.remainder_y + y)
+            if notches:
+                events.append(pack(INPUT_EVENT, 0, 0, EV_REL, REL_WHEEL,
+                                   notches))
+        if x:
+            events.append(pack(INPUT_EVENT, 0, 0, EV_REL, REL_HWHEEL_HI_RES,
+                               x))
+            self.remainder_x, notches = self._notches(self.remainder_x + x)
+            if notches:
+                events.append(pack(INPUT_EVENT, 0, 0, EV_REL, REL_HWHEEL,
+                                   notches))
+        if not events:
+            return
+        events.append(pack(INPUT_EVENT, 0, 0, EV_SYN, SYN_REPORT, 0))
+        # one write, one report
+        os_write(self.fd, b''.join(events))
+
+    def close(self) -> None:
+        if self.fd < 0:
+            return
+        try:
+            ioctl(self.fd, UI_DEV_DESTROY)
+        except OSError:
+            pass
+        os_close(self.fd)
+        self.fd = -1
+
+    @staticmethod
+    def _notches(value: int):
+        # full notches towards zero and what is left
+        notches = int(value / NOTCH)
+        return value - notches * NOTCH, notches
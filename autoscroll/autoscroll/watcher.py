@@ -0,0 +1,97 @@
+from asyncio import Event, get_running_loop, wait_for
+from asyncio import TimeoutError as AsyncioTimeoutError
+from os import close as os_close, read as os_read, strerror as os_strerror
+from os.path import abspath as os_abspath, basename as os_basename, dirname as os_dirname
+from struct import calcsize, unpack_from
+from .constants import CONFIG_DEBOUNCE
+
+# linux/inotify.h
+IN_CLOSE_WRITE: int = 0x00000008
+IN_MOVED_TO: int = 0x00000080
+IN_NONBLOCK: int = 0o4000
+IN_CLOEXEC: int = 0o2000000
+IN_EVENT: str = 'iIII'
+IN_EVENT_SIZE: int = calcsize(IN_EVENT)
+IN_BUFFER_SIZE: int = 64 * (IN_EVENT_SIZE + 256)
+
+
+class Watcher:
+    """
+    waits for a file to be written or replaced using inotify, linux only
+
+    the directory is watched instead of the file itself, so atomic renames
+    (the way most editors save files) are picked up too
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.name = os_basename(path).encode()
+        try:
+            # ctypes is imported only if the config file is enabled
+            from ctypes import CDLL, get_errno
+            self._get_errno = get_errno
+            # symbols of the running process, libc included, without
+            # looking for the library on disk
+            libc = CDLL(None, use_errno=True)
+            self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        except (AttributeError, ImportError, OSError) as exception:
+            raise OSError('inotify is not available') from exception
+        self._raise_if_error(self.fd)
+        watch = libc.inotify_add_watch(
+            self.fd, os_dirname(os_abspath(path)).encode(),
+            IN_CLOSE_WRITE | IN_MOVED_TO)
+        if watch < 0:
+            self.close()
+        self._raise_if_error(watch)
+
+    async def wait(self, timeout: float = None) -> bool:
+        """
+        returns True if the file has changed before the timeout
+
+        a burst of events (an editor writing the file several times) is
+        coalesced, it returns only once the file has not been written for
+        CONFIG_DEBOUNCE seconds, writes to other files do not count
+        """
+        loop, readable = get_running_loop(), Event()
+        loop.add_reader(self.fd, readable.set)
+        changed = False
+        # events for other files in the directory do not move it
+        deadline = None if timeout is None else loop.time() + timeout
+        try:
+            while True:
+                try:
+                    await wait_for(readable.wait(), None if deadline is None
+                                   else max(deadline - loop.time(), 0))
+                except AsyncioTimeoutError:
+                    return changed
+                readable.clear()
+                if self._read():
+                    changed = True
+                    deadline = loop.time() + CONFIG_DEBOUNCE
+        finally:
+            loop.remove_reader(self.fd)
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os_close(self.fd)
+            self.fd = -1
+
+    def _read(self) -> bool:
+        try:
+            buffer = os_read(self.fd, IN_BUFFER_SIZE)
+        except BlockingIOError:
+            # already read, the loop saw it readable before that
+            return False
+        changed, offset = False, 0
+        while offset < len(buffer):
+            _, _, _, length = unpack_from(IN_EVENT, buffer, offset)
+            offset += IN_EVENT_SIZE
+            name = buffer[offset:offset + length].rstrip(b'\0')
+            offset += length
+            changed = changed or name == self.name
+        return changed
+
+    def _raise_if_error(self, result: int) -> None:
+        if result < 0:
+            errno = self._get_errno()
+            raise OSError(errno, os_strerror(errno))
@@ -0,0 +1,129 @@
+from select import select
+from socket import socketpair
+from threading import Event, Thread
+from typing import Dict, List, Tuple
+from Xlib import X
+from Xlib.display import Display
+from Xlib.error import (BadWindow, CatchError, ConnectionClosedError,
+                        DisplayError, XError)
+from Xlib.xobject.drawable import Window
+from .constants import PROFILES_WINDOW_DEPTH
+
+
+class Windows:
+    """
+    the top-level window under the pointer and its WM_CLASS, tracked over
+    one X connection in a background thread, x11 only
+
+    every top-level window reports the pointer entering and leaving it, so
+    the window is known before a button is pressed. its class is looked up
+    the first time the pointer enters it and cached by window id until the
+    window is destroyed, reading classes never waits for the x server
+    """
+
+    def __init__(self, display: str = None, daemon: bool = True) -> None:
+        try:
+            self.display = Display(display)
+        except DisplayError as exception:
+            raise OSError(str(exception)) from exception
+        self.root: Window = self.display.screen().root
+        # instance and class name of the window under the pointer,
+        # lowercase, empty over the root window
+        self.classes: Tuple[str, ...] = ()
+        self.window: int = X.NONE
+        self.cache: Dict[int, Tuple[str, ...]] = {}
+        # a window can be destroyed before its events are selected
+        self.catch: CatchError = CatchError(BadWindow)
+        self.event_stop: Event = Event()
+        # stop wakes the thread up through it
+        self.wake_read, self.wake_write = socketpair()
+        self.thread: Thread = Thread(target=self.run, daemon=daemon)
+        # top-level windows being created and destroyed
+        self.root.change_attributes(event_mask=X.SubstructureNotifyMask)
+        for window in self.root.query_tree().children:
+            self._select(window)
+        # where the pointer is now, events tell where it goes next
+        self._enter(self.root.query_pointer().child)
+        self.display.flush()
+
+    def run(self) -> None:
+        try:
+            while not self.event_stop.is_set():
+                # events that have already been read are not seen by select
+                while self.display.pending_events():
+                    self._handle(self.display.next_event())
+                self.display.flush()
+                select((self.display.fileno(), self.wake_read), (), ())
+        except ConnectionClosedError:
+            # the x server is gone
+            self.window, self.classes = X.NONE, ()
+        finally:
+            self.close()
+
+    def start(self) -> None: self.thread.start()
+
+    def stop(self) -> None:
+        self.event_stop.set()
+        try:
+            self.wake_write.send(b'\0')
+        except OSError:
+            pass
+
+    def join(self, timeout: float = None) -> None: self.thread.join(timeout)
+
+    def close(self) -> None:
+        self.display.close()
+        self.wake_read.close()
+        self.wake_write.close()
+
+    def _handle(self, event: object) -> None:
+        if event.type == X.EnterNotify:
+            self._enter(event.window)
+        elif event.type == X.LeaveNotify:
+            # into one of its own children, the pointer is still inside
+            if (event.window.id == self.window
+                    and event.detail != X.NotifyInferior
+                    and event.mode == X.NotifyNormal):
+                self.window, self.classes = X.NONE, ()
+        elif event.type == X.CreateNotify:
+            self._select(event.window)
+        elif event.type == X.DestroyNotify:
+            # window ids are reused, the class goes with the window
+            self.cache.pop(event.window.id, None)
+            if event.window.id == self.window:
+                self.window, self.classes = X.NONE, ()
+
+    def _select(self, window: Window) -> None:
+        window.change_attributes(
+            event_mask=X.EnterWindowMask | X.LeaveWindowMask,
+            onerror=self.catch)
+
+    def _enter(self, window: Window) -> None:
+        if not window:
+            return
+        classes = self.cache.get(window.id)
+        if classes is None:
+            classes = self._get_classes(window)
+            # not set yet, looked up again next time
+            if classes:
+                self.cache[window.id] = classes
+        self.window, self.classes = window.id, classes
+
+    @staticmethod
+    def _get_classes(window: Window) -> Tuple[str, ...]:
+        # window managers put the window of an application inside a frame
+        # of their own, the class is on the first window that has one
+        windows: List[Tuple[Window, int]] = [(window, 0)]
+        try:
+            while windows:
+                window, depth = windows.pop(0)
+                names = window.get_wm_class()
+                if names:
+                    return tuple(name.lower() for name in names)
+                if depth < PROFILES_WINDOW_DEPTH:
+                    windows.extend((child, depth + 1) for child in
+                                   window.query_tree().children)
+        except XError:
+            # destroyed in the meantime
+            pass
+        return ()
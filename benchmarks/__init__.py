@@ -0,0 +1,5 @@
+# benchmarks run headless: pynput's dummy backend, offscreen qt
+from os import environ as os_environ
+
+os_environ.setdefault('PYNPUT_BACKEND', 'dummy')
+os_environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
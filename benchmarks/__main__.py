@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# runs the benchmarks and writes the results as json, for comparing
+# commits
+#
+# python3 -m benchmarks [--output results.json] [benchmark ...]
+
+from argparse import ArgumentParser
+from json import dumps, loads
+from platform import platform, python_version
+from subprocess import run as subprocess_run
+from sys import executable as sys_executable
+from time import time
+from typing import Any, Dict, List
+
+BENCHMARKS: List[str] = ['pipeline', 'on_move', 'idle', 'evdev', 'config',
+                         'runtime', 'profiles', 'recorder', 'startup',
+                         'icon', 'icon_handoff', 'shutdown']
+
+
+def commit() -> str:
+    process = subprocess_run(('git', 'rev-parse', '--short', 'HEAD'),
+                             capture_output=True, text=True)
+    return process.stdout.strip() if process.returncode == 0 else None
+
+
+def measure(name: str) -> Dict[str, Any]:
+    # every benchmark gets its own interpreter, nothing imported, cached or
+    # started by one (the qt application) affects the others, one that
+    # fails or crashes is recorded as an error and the others still run
+    process = subprocess_run(
+        (sys_executable, '-c', f'from json import dumps\n'
+                               f'from {__package__}.{name} import run\n'
+                               'print(dumps(run()))'),
+        capture_output=True, text=True)
+    lines = process.stdout.splitlines()
+    if process.returncode == 0 and lines:
+        try:
+            return loads(lines[-1])
+        except ValueError:
+            pass
+    errors = process.stderr.strip().splitlines()
+    return {'error': errors[-1] if errors
+            else f'exited with {process.returncode}'}
+
+
+def measure_all(names: List[str]) -> Dict[str, Any]:
+    return {'commit': commit(), 'python': python_version(),
+            'platform': platform(), 'time': int(time()),
+            'results': {name: measure(name) for name in names}}
+
+
+def main() -> None:
+    parser = ArgumentParser(prog='python3 -m benchmarks')
+    parser.add_argument('benchmarks', nargs='*',
+                        help=f'any of {", ".join(BENCHMARKS)}, '
+                             'all of them by default')
+    parser.add_argument('-o', '--output', help='file, stdout by default')
+    arguments = parser.parse_args()
+    for name in arguments.benchmarks:
+        if name not in BENCHMARKS:
+            parser.error(f'unknown benchmark - {name}')
+    result = dumps(measure_all(arguments.benchmarks or BENCHMARKS), indent=2)
+    if arguments.output is None:
+        print(result)
+        return
+    with open(arguments.output, 'w') as output:
+        output.write(result + '\n')
+
+
+if __name__ == '__main__':
+    main()
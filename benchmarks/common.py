@@ -0,0 +1,61 @@
+from math import cos, sin, tau
+from time import perf_counter
+from typing import Callable, Iterable, List, Tuple
+
+from pynput.mouse import Button
+
+from autoscroll.autoscroll import Autoscroll
+from autoscroll.autoscroll.backends import RecordingSink, ReplaySource
+
+# where the scrolling starts in every trace
+START: Tuple[int, int] = (500, 500)
+# 1000 Hz mouse
+MOTION_RATE: int = 1000
+
+
+def motion(events: int, radius: int = 200,
+           rate: int = MOTION_RATE) -> List[Tuple[int, int, int]]:
+    # (time_ns, x, y), the pointer circling around the starting point and
+    # moving away from it and back
+    result = []
+    for i in range(events):
+        angle = tau * i / 2000
+        distance = radius * (0.5 + 0.5 * sin(tau * i / 5000))
+        result.append((i * 10**9 // rate,
+                       START[0] + int(distance * cos(angle)),
+                       START[1] + int(distance * sin(angle))))
+    return result
+
+
+def clicks(count: int, button: Button = Button.middle) -> List[Tuple]:
+    # (time_ns, x, y, button, pressed), start and end of the scrolling, the
+    # button as the listener passes it on
+    result = []
+    for i in range(count):
+        result.append((i * 2, START[0], START[1], button, True))
+        result.append((i * 2 + 1, START[0], START[1], button, True))
+    return result
+
+
+def headless(events: Iterable[Tuple] = (), speed: float = 0,
+             **kwargs) -> Autoscroll:
+    # no display: replayed input, scroll events are recorded, see
+    # ReplaySource for speed
+    def source(**source_kwargs) -> ReplaySource:
+        return ReplaySource(events=events, speed=speed, **source_kwargs)
+    autoscroll = Autoscroll(source=source, **kwargs)
+    autoscroll.scrolling.update(backend='recording')
+    return autoscroll
+
+
+def rate(function: Callable, arguments: Iterable[Tuple]) -> float:
+    # calls per second
+    arguments = list(arguments)
+    start = perf_counter()
+    for item in arguments:
+        function(*item)
+    return len(arguments) / (perf_counter() - start)
+
+
+def sink(autoscroll: Autoscroll) -> RecordingSink:
+    return autoscroll.scrolling.controller
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# config file reloads: the time to parse and apply a changed file, the time
+# to find out that the file has not changed, and the time from a write to
+# the reload coroutine waking up (inotify on linux, polling otherwise)
+# and the same options sent through the control socket, a round trip
+#
+# python3 -m benchmarks.config
+
+from asyncio import run as asyncio_run
+from os.path import exists as path_exists, join as path_join
+from socket import AF_UNIX, socket
+from statistics import median
+from tempfile import TemporaryDirectory
+from threading import Thread
+from time import perf_counter, sleep
+from typing import Dict
+
+from . import common
+
+RELOADS: int = 500
+REQUESTS: int = 1000
+WRITES: int = 10
+# seconds, what the reload coroutine polls at without inotify
+INTERVAL: int = 1
+
+
+def write(path: str, speed: int) -> None:
+    with open(path, 'w') as config_file:
+        config_file.write(f'--scrolling-speed {speed}\n'
+                          '--scrolling-dead-area 40\n')
+
+
+def reload(path: str, reloads: int = RELOADS) -> Dict[str, float]:
+    autoscroll = common.headless()
+    config = autoscroll.config
+    config.update(path=path, enable=True, interval=INTERVAL)
+    changed, unchanged = [], []
+    for i in range(reloads):
+        write(path, 100 + i)
+        start = perf_counter()
+        config.apply_config_file(autoscroll.update)
+        changed.append(perf_counter() - start)
+        start = perf_counter()
+        config.apply_config_file(autoscroll.update)
+        unchanged.append(perf_counter() - start)
+    return {'changed': median(changed) * 1e6,
+            'unchanged': median(unchanged) * 1e6}
+
+
+def latency(path: str, writes: int = WRITES) -> float:
+    config = common.headless().config
+    config.update(path=path, enable=True, interval=INTERVAL)
+    # the watcher is created before the first write
+    config._get_watcher()
+    result = []
+    for i in range(writes):
+        woken = []
+        thread = Thread(target=lambda: (
+            asyncio_run(config.wait_for_change()),
+            woken.append(perf_counter())))
+        thread.start()
+        sleep(0.05)
+        start = perf_counter()
+        write(path, 100 + i)
+        thread.join()
+        result.append(woken[0] - start)
+    return median(result) * 1e3
+
+
+def remote(path: str, requests: int = REQUESTS) -> float:
+    autoscroll = common.headless()
+    autoscroll.update(remote={'enable': True, 'path': path})
+    autoscroll.thread_loop.start()
+    while not path_exists(path):
+        sleep(0.01)
+    client = socket(AF_UNIX)
+    client.connect(path)
+    result = []
+    for i in range(requests):
+        start = perf_counter()
+        client.sendall(f'--scrolling-speed {100 + i} '
+                       '--scrolling-dead-area 40\n'.encode())
+        client.recv(64)
+        result.append(perf_counter() - start)
+    client.close()
+    # the socket is removed before the loop finishes
+    autoscroll.stop()
+    autoscroll.thread_loop.join()
+    return median(result) * 1e6
+
+
+def run() -> Dict[str, float]:
+    with TemporaryDirectory() as directory:
+        path = path_join(directory, 'autoscroll.txt')
+        write(path, 100)
+        result = {f'reload_{name}_us': value
+                  for name, value in reload(path).items()}
+        result['change_latency_ms'] = latency(path)
+        result['remote_us'] = remote(path_join(directory, 'control.sock'))
+    return result
+
+
+def main() -> None:
+    result = run()
+    print(f'reload, changed:   {result["reload_changed_us"]:8.1f}us')
+    print(f'reload, unchanged: {result["reload_unchanged_us"]:8.1f}us')
+    print(f'write to wake up:  {result["change_latency_ms"]:8.1f}ms')
+    print(f'control socket:    {result["remote_us"]:8.1f}us')
+
+
+if __name__ == '__main__':
+    main()
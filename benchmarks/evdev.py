@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# the evdev listener:
+# - motion reports decoded and passed to on_move per second, written as
+#   fast as they are read
+# - time from an event's timestamp to its handler, 1000 reports per second
+#
+# the reports go through a virtual uinput mouse if /dev/uinput is
+# writable, the kernel timestamps them, otherwise through a fifo standing
+# in for the device, timestamped by the writer
+#
+# python3 -m benchmarks.evdev
+
+from glob import glob
+from os import O_RDWR, close as os_close, mkfifo, open as os_open
+from os import write as os_write
+from os.path import dirname as os_path_dirname, join as os_path_join
+from struct import pack
+from tempfile import TemporaryDirectory
+from threading import Event
+from time import monotonic_ns, sleep
+from typing import Callable, Dict, Tuple
+
+from autoscroll.autoscroll.constants import SCROLLING_UINPUT_NAME
+from autoscroll.autoscroll.evdev import Listener
+from autoscroll.autoscroll.metrics import Histogram
+from autoscroll.autoscroll.uinput import (EV_REL, EV_SYN, INPUT_EVENT, REL_X,
+                                         REL_Y, SYN_REPORT)
+
+REPORTS: int = 100_000
+# reports written at once
+BATCH: int = 20
+RATE: int = 1000
+DURATION: float = 1
+
+
+def report(timestamp: bool) -> bytes:
+    # 1 unit right and down, stamped now unless the kernel does it
+    seconds, microseconds = divmod(monotonic_ns() // 1000, 10**6) \
+        if timestamp else (0, 0)
+    return b''.join(pack(INPUT_EVENT, seconds, microseconds, kind, code,
+                         value)
+                    for kind, code, value in ((EV_REL, REL_X, 1),
+                                              (EV_REL, REL_Y, 1),
+                                              (EV_SYN, SYN_REPORT, 0)))
+
+
+def uinput() -> Tuple[str, int, Callable[[], None]]:
+    # event device path, file descriptor to write to and how to close it
+    from autoscroll.autoscroll.uinput import Controller
+    controller = Controller()
+    for _ in range(100):
+        for path in glob('/sys/class/input/event*/device/name'):
+            with open(path) as name:
+                if name.read().strip() == SCROLLING_UINPUT_NAME:
+                    device = os_path_join(
+                        '/dev/input', os_path_dirname(path).split('/')[-2])
+                    # udev may not have made it readable yet
+                    sleep(0.5)
+                    return device, controller.fd, controller.close
+        sleep(0.01)
+    controller.close()
+    raise OSError('the virtual mouse did not show up')
+
+
+def measure(device: str, fd: int, timestamp: bool) -> Dict[str, float]:
+    received, done = [0], Event()
+
+    def on_move(x: int, y: int) -> None:
+        received[0] += 1
+        if received[0] == REPORTS:
+            done.set()
+    listener = Listener(on_move=on_move, device=device)
+    listener.start()
+    start = monotonic_ns()
+    batch = report(timestamp) * BATCH
+    for _ in range(REPORTS // BATCH):
+        os_write(fd, batch)
+    done.wait(10)
+    throughput = received[0] / ((monotonic_ns() - start) / 1e9)
+    # only the paced reports count
+    latency = listener.latency = Histogram('latency', '')
+    for _ in range(int(RATE * DURATION)):
+        os_write(fd, report(timestamp))
+        sleep(1 / RATE)
+    listener.stop()
+    listener.join()
+    return {'reports_per_second': throughput,
+            'latency_p50_us': latency.percentile(50) / 1e3,
+            'latency_p99_us': latency.percentile(99) / 1e3,
+            'latency_max_us': latency.max / 1e3}
+
+
+def run() -> Dict[str, float]:
+    try:
+        device, fd, close = uinput()
+    except (ImportError, OSError):
+        pass
+    else:
+        try:
+            return {'uinput': 1, **measure(device, fd, timestamp=False)}
+        finally:
+            close()
+    with TemporaryDirectory() as directory:
+        device = os_path_join(directory, 'event')
+        mkfifo(device)
+        # opened for reading and writing, so neither side blocks
+        fd = os_open(device, O_RDWR)
+        try:
+            return {'uinput': 0, **measure(device, fd, timestamp=True)}
+        finally:
+            os_close(fd)
+
+
+def main() -> None:
+    result = run()
+    print('device:  ', 'uinput virtual mouse' if result['uinput'] else 'fifo')
+    print(f'reports:  {result["reports_per_second"]:10.0f}/s')
+    print(f'latency:  p50 {result["latency_p50_us"]:.0f}us, '
+          f'p99 {result["latency_p99_us"]:.0f}us, '
+          f'max {result["latency_max_us"]:.0f}us')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# startup time and peak memory with and without the icon
+# the icon case includes importing pyside6, starting the qt application
+# and creating the icon widget, which happens in the background once
+# the listener is running
+#
+# python3 -m benchmarks.icon
+
+from os import environ as os_environ
+from statistics import median
+from subprocess import run as subprocess_run
+from sys import executable as sys_executable
+from typing import Dict
+
+RUNS: int = 5
+
+SCRIPT: str = '''
+from resource import getrusage, RUSAGE_SELF
+from time import perf_counter
+start = perf_counter()
+from autoscroll.autoscroll.support import Icon
+icon = Icon(enable={enable})
+ready = perf_counter()
+if icon.enable:
+    qt = icon._get_qt()
+    icon.application = qt.get_application()
+    icon._create_icon(qt)
+    icon.show(100, 100)
+    icon.application.processEvents()
+shown = perf_counter()
+print(ready - start, shown - start, getrusage(RUSAGE_SELF).ru_maxrss)
+'''
+
+
+def measure(enable: bool, runs: int = RUNS) -> Dict[str, float]:
+    environment = {'PYNPUT_BACKEND': 'dummy', 'QT_QPA_PLATFORM': 'offscreen',
+                   **os_environ}
+    ready, shown, memory = [], [], []
+    for _ in range(runs):
+        process = subprocess_run(
+            (sys_executable, '-c', SCRIPT.format(enable=enable)),
+            check=True, env=environment, capture_output=True, text=True)
+        result = process.stdout.split()
+        ready.append(float(result[0]))
+        shown.append(float(result[1]))
+        memory.append(int(result[2]))
+    return {'ready': median(ready), 'shown': median(shown),
+            'memory': median(memory)}
+
+
+def run() -> Dict[str, float]:
+    try:
+        import PySide6  # noqa: F401
+    except ImportError:
+        cases = (False,)
+    else:
+        cases = (False, True)
+    result = {}
+    for enable in cases:
+        name = 'enabled' if enable else 'disabled'
+        measured = measure(enable)
+        result[f'{name}_ready_ms'] = measured['ready'] * 1e3
+        result[f'{name}_shown_ms'] = measured['shown'] * 1e3
+        result[f'{name}_rss_mib'] = measured['memory'] / 1024
+    return result
+
+
+def main() -> None:
+    result = run()
+    if 'enabled_ready_ms' not in result:
+        print('pyside6 is not installed, only measuring without the icon')
+    for name in ('disabled', 'enabled'):
+        if f'{name}_ready_ms' not in result:
+            continue
+        print(f'icon {name + ":":9} '
+              f'ready {result[f"{name}_ready_ms"]:7.1f}ms, '
+              f'icon shown {result[f"{name}_shown_ms"]:7.1f}ms, '
+              f'max rss {result[f"{name}_rss_mib"]:6.1f}MiB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# time the listener thread spends showing and hiding the icon on clicks,
+# before (the widget called directly, measured in the qt thread because
+# calling it from another thread crashes) and after (requests queued to
+# the qt thread from a listener thread)
+#
+# python3 -m benchmarks.icon_handoff
+
+from statistics import median
+from threading import Thread
+from time import perf_counter_ns
+from typing import Callable, Dict, List
+
+CLICKS: int = 1_000
+
+
+def listener(show: Callable[[int, int], None], hide: Callable[[], None],
+             result: List[int], clicks: int = CLICKS) -> None:
+    for i in range(clicks):
+        start = perf_counter_ns()
+        show(100 + i % 100, 100)
+        hide()
+        result.append(perf_counter_ns() - start)
+
+
+def measure(show: Callable[[int, int], None], hide: Callable[[], None],
+            application, threaded: bool) -> Dict[str, float]:
+    result = []
+    if threaded:
+        thread = Thread(target=listener, args=(show, hide, result))
+        thread.start()
+        # the qt thread keeps handling events like it would in exec()
+        while thread.is_alive():
+            application.processEvents()
+    else:
+        listener(show, hide, result)
+    application.processEvents()
+    result.sort()
+    return {'median': median(result) / 1e3,
+            'p99': result[int(len(result) * 0.99)] / 1e3,
+            'max': result[-1] / 1e3}
+
+
+def run() -> Dict[str, float]:
+    # empty without pyside6
+    try:
+        from autoscroll.autoscroll import qt
+    except ImportError:
+        return {}
+    from autoscroll.autoscroll.support import Icon
+    icon = Icon(enable=True)
+    icon.application = qt.get_application()
+    icon._create_icon(qt)
+    icon.event_qt_application_started.set()
+    widget = icon.icon
+    result = {}
+    for name, show, hide, threaded in (
+            ('before', widget.show, widget.hide, False),
+            ('after', icon.show, icon.hide, True)):
+        for key, value in measure(show, hide, icon.application,
+                                  threaded).items():
+            result[f'{name}_{key}_us'] = value
+    return result
+
+
+def main() -> None:
+    result = run()
+    if not result:
+        print('pyside6 is not installed')
+        return
+    for name in ('before', 'after'):
+        print(f'{name}: median {result[f"{name}_median_us"]:8.1f}us, '
+              f'p99 {result[f"{name}_p99_us"]:8.1f}us, '
+              f'max {result[f"{name}_max_us"]:8.1f}us '
+              'per click')
+
+
+if __name__ == '__main__':
+    main()
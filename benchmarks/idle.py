@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# the cost of pointer motion while not scrolling, which is most of the
+# time:
+# - cpu time per motion event replayed as fast as possible, with motion
+#   reaching _on_move all the time (before) and only while scrolling (after)
+# - cpu usage and scroll thread wakeups per second over a 1000 Hz motion
+#   trace replayed in real time, in classic and lazy mode, after one
+#   scroll has started and stopped
+#
+# python3 -m benchmarks.idle
+
+from time import process_time, sleep
+from typing import Dict
+
+from autoscroll.autoscroll import Autoscroll
+
+from . import common
+
+EVENTS: int = 1_000_000
+# seconds of motion replayed in real time
+DURATION: float = 3
+
+
+def switches(autoscroll: Autoscroll) -> int:
+    # context switches of the thread scrolling runs in, linux only
+    path = f'/proc/self/task/{autoscroll.thread_loop.native_id}/status'
+    with open(path) as status:
+        return sum(int(line.split()[1]) for line in status
+                   if 'ctxt_switches' in line)
+
+
+def per_event(attached: bool, events: int = EVENTS) -> float:
+    # cpu nanoseconds per motion event, the listener thread included
+    autoscroll = common.headless(common.motion(events))
+    if attached:
+        autoscroll.listener.attach()
+    start = process_time()
+    autoscroll.thread_scroll_listener.start()
+    autoscroll.thread_scroll_listener.join()
+    return (process_time() - start) * 1e9 / events
+
+
+def real_time(lazy: bool, duration: float = DURATION) -> Dict[str, float]:
+    autoscroll = common.headless(
+        common.motion(int(duration * common.MOTION_RATE)), speed=1)
+    autoscroll.update(scrolling={'lazy': lazy})
+    autoscroll.thread_loop.start()
+    # one scroll, so the scroll thread has been through a start and a stop
+    autoscroll._on_click(*common.START, autoscroll.buttons.start, True)
+    autoscroll._on_move(common.START[0], common.START[1] + 100)
+    sleep(0.1)
+    autoscroll._on_click(*common.START, autoscroll.buttons.start, True)
+    sleep(0.1)
+    switched, start = switches(autoscroll), process_time()
+    autoscroll.thread_scroll_listener.start()
+    autoscroll.thread_scroll_listener.join()
+    result = {'cpu': (process_time() - start) / duration * 100,
+              'wakeups': (switches(autoscroll) - switched) / duration}
+    autoscroll.stop()
+    autoscroll.thread_loop.join()
+    return result
+
+
+def run() -> Dict[str, float]:
+    result = {'per_event_before': per_event(attached=True),
+              'per_event_after': per_event(attached=False)}
+    for lazy in (False, True):
+        for name, value in real_time(lazy).items():
+            result[f'{"lazy" if lazy else "classic"}_{name}'] = value
+    return result
+
+
+def main() -> None:
+    result = run()
+    before, after = result['per_event_before'], result['per_event_after']
+    print(f'per event, before: {before:6.0f} ns')
+    print(f'per event, after:  {after:6.0f} ns ({before / after:.1f}x)')
+    for name in ('classic', 'lazy'):
+        print(f'{name + ",":8} {common.MOTION_RATE} Hz: '
+              f'{result[f"{name}_cpu"]:4.1f}% cpu, '
+              f'{result[f"{name}_wakeups"]:5.1f} scroll thread wakeups/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# pointer motion events per second, before (the validated Coordinates
+# path _on_move used to take, copied below since it has been removed) and
+# after (Motion), and the lazy mode where the listener only stores the
+# position and the scroll loop applies it once per tick (1000 Hz motion,
+# 10 ms ticks)
+#
+# python3 -m benchmarks.on_move
+
+from time import perf_counter
+from typing import Any, Dict, Iterable, Tuple, Union
+
+from autoscroll.autoscroll.constants import SCROLLING_SLEEP_INTERVAL_INITIAL
+from autoscroll.autoscroll.functions import raise_type_error
+from autoscroll.autoscroll.support import Base, Scrolling
+
+EVENTS: int = 200_000
+# motion events per scroll tick in lazy mode
+EVENTS_PER_TICK: int = 10
+
+
+def trace(events: int = EVENTS):
+    # a pointer circling around the starting point
+    return [(500 + (i % 400) - 200, 500 + (i * 7 % 400) - 200)
+            for i in range(events)]
+
+
+class Coordinate(Base):
+    # as it was in support.py, only what _on_move used
+
+    def update(self, current: Union[int, str] = None,
+               previous: Union[int, str] = None,
+               initial: Union[int, str] = None) -> None:
+        self.initial: int = initial
+        self.previous: int = previous
+        self.current: int = current
+
+    def distance(self, absolute: bool = False) -> int:
+        distance = self.initial - self.current
+        return abs(distance) if absolute else distance
+
+    def direction(self) -> int:
+        return (self.distance() == 0) + (1 if self.distance() > 0 else -1)
+
+    @property
+    def current(self) -> int: return self._current
+
+    @property
+    def previous(self) -> int: return self._previous
+
+    @property
+    def initial(self) -> int: return self._initial
+
+    @current.setter
+    def current(self, value: int) -> None:
+        _current = getattr(self, '_current', None)
+        self._set('_current', 0, value, (str, int), int)
+        self._set('_previous', 0, _current, (str, int), int)
+
+    @previous.setter
+    def previous(self, value: int) -> None:
+        self._set('_previous', 0, value, (str, int), int)
+
+    @initial.setter
+    def initial(self, value: int) -> None:
+        self._set('_initial', 0, value, (str, int), int)
+
+
+class Coordinates(Base):
+    # as it was in support.py, only what _on_move used
+
+    def update(self, x: Union[Coordinate, str, int] = None,
+               y: Union[Coordinate, str, int] = None,
+               name: str = None) -> None:
+        self.x: Coordinate = x
+        self.y: Coordinate = y
+        self.name: str = self._convert(name, 'coordinates', str)
+
+    def direction(self) -> Tuple[int, int]:
+        return (self.x.direction(), self.y.direction())
+
+    def distance(self, absolute: bool = False) -> Tuple[int, int]:
+        return self.x.distance(absolute), self.y.distance(absolute)
+
+    @property
+    def x(self) -> Coordinate: return self._x
+
+    @property
+    def y(self) -> Coordinate: return self._y
+
+    @property
+    def current(self) -> Tuple[int, int]:
+        return (self.x.current, self.y.current)
+
+    @property
+    def initial(self) -> Tuple[int, int]:
+        return (self.x.initial, self.y.initial)
+
+    @y.setter
+    def y(self, value: Union[str, int, Coordinate]) -> None:
+        self._set('_y', Coordinate(), value, (Coordinate, str, int),
+                  self._convert_coordinate, name='_y')
+
+    @x.setter
+    def x(self, value: Union[str, int, Coordinate]) -> None:
+        self._set('_x', Coordinate(), value, (Coordinate, str, int),
+                  self._convert_coordinate, name='_x')
+
+    @current.setter
+    def current(self, value: Tuple[Union[str, int], Union[str, int]]) -> None:
+        self.x.current, self.y.current = self._convert(
+            value, (None, None), Iterable, self._convert_iterable)
+
+    @initial.setter
+    def initial(self, value: Tuple[Union[str, int], Union[str, int]]) -> None:
+        self.x.initial, self.y.initial = self._convert(
+            value, (None, None), Iterable, self._convert_iterable)
+
+    def _convert_coordinate(self, value: Union[Coordinate, int],
+                            name: str) -> Coordinate:
+        if isinstance(value, (int, str)):
+            coordinate = getattr(self, name)
+            setattr(coordinate, 'current', int(value))
+            return coordinate
+        return raise_type_error(value, Coordinate)
+
+    def _convert_iterable(self, value: Any) -> Tuple[int, int]:
+        raise_type_error(value, Iterable)
+        x, y = None, None
+        if len(value) >= 1:
+            x = self._convert(value[0], None, (str, int), int)
+        if len(value) >= 2:
+            y = self._convert(value[1], None, (str, int), int)
+        return x, y
+
+
+def legacy(scrolling: Scrolling):
+    # the path _on_move used to take, the baseline
+    coordinates = Coordinates()
+    direction = Coordinates(name='direction')
+    coordinates.initial = 500, 500
+
+    def on_move(x: int, y: int) -> None:
+        coordinates.update(x, y)
+        distance = coordinates.distance(absolute=True)
+        direction.current = ((0, 0) if distance[0] <= scrolling.dead_area
+                             and distance[1] <= scrolling.dead_area
+                             else coordinates.direction())
+        interval = scrolling.acceleration * max(distance) + scrolling.speed
+        coordinates.sleep_interval = abs(100 / interval) \
+            if interval else SCROLLING_SLEEP_INTERVAL_INITIAL
+    return on_move
+
+
+def fast(scrolling: Scrolling):
+    scrolling.set_initial_coordinates(500, 500)
+    return scrolling.move
+
+
+def lazy(scrolling: Scrolling):
+    scrolling.update(lazy=True)
+    scrolling.set_initial_coordinates(500, 500)
+    counter = [0]
+
+    def on_move(x: int, y: int) -> None:
+        # what _on_move does in lazy mode
+        scrolling.position = x, y
+        # what the scroll loop does once per tick
+        counter[0] += 1
+        if counter[0] == EVENTS_PER_TICK:
+            counter[0] = 0
+            scrolling.apply_position()
+    return on_move
+
+
+def measure(on_move, events) -> float:
+    start = perf_counter()
+    for x, y in events:
+        on_move(x, y)
+    return len(events) / (perf_counter() - start)
+
+
+def run() -> Dict[str, float]:
+    events = trace()
+    scrolling = Scrolling()
+    return {'before': measure(legacy(scrolling), events),
+            'motion': measure(fast(scrolling), events),
+            'lazy': measure(lazy(scrolling), events)}
+
+
+def main() -> None:
+    result = run()
+    before, motion, motion_lazy = \
+        result['before'], result['motion'], result['lazy']
+    print(f'before: {before:12.0f} events/s')
+    print(f'motion: {motion:12.0f} events/s ({motion / before:.1f}x)')
+    print(f'lazy:   {motion_lazy:12.0f} events/s '
+          f'({motion_lazy / before:.1f}x), {EVENTS_PER_TICK} events per tick')
+
+
+if __name__ == '__main__':
+    main()
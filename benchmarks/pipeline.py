@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# the hot paths of a running Autoscroll, without a display: replayed input,
+# scroll events recorded in memory
+# - _on_move events per second while scrolling, classic and lazy mode, and
+#   with tracing enabled
+# - _on_click latency, a start and an end click, and with tracing enabled
+# - interval cost, what every motion event spends on the sleep interval
+# - scroll loop ticks versus the target rate and how late they are
+# - diagonal scrolling, both axes at the same rate or each at its own
+# - the linear curve against the formula it replaced, the distances where
+#   they differ while the interval is above SCROLLING_INTERVAL_MINIMUM,
+#   none, and the first distance where it is capped
+#
+# python3 -m benchmarks.pipeline
+
+from os import devnull
+from statistics import median
+from time import perf_counter, perf_counter_ns, sleep
+from typing import Any, Dict
+
+from autoscroll.autoscroll import Autoscroll
+from autoscroll.autoscroll.constants import (SCROLLING_INTERVAL_MINIMUM,
+                                             SCROLLING_SLEEP_INTERVAL_INITIAL,
+                                             SCROLLING_SPEED)
+from autoscroll.autoscroll.curves import build_table
+
+from . import common
+
+EVENTS: int = 100_000
+CLICKS: int = 2_000
+# seconds the scroll loop runs for
+DURATION: float = 1.0
+# distance from the starting point and acceleration while the scroll loop
+# runs, about 150 units per second
+DISTANCE: int = 150
+ACCELERATION: int = 100
+
+
+# written to nowhere, only the cost of recording is measured
+TRACE: Dict[str, Any] = {'scroll': True, 'click': True, 'trace': devnull}
+
+
+def on_move(lazy: bool = False, trace: bool = False,
+            events: int = EVENTS) -> float:
+    autoscroll = common.headless()
+    autoscroll.update(scrolling={'lazy': lazy},
+                      debug=TRACE if trace else None)
+    autoscroll._on_click(*common.START, autoscroll.buttons.start, True)
+    return common.rate(autoscroll._on_move,
+                       (event[1:] for event in common.motion(events)))
+
+
+def on_click(trace: bool = False, clicks: int = CLICKS) -> Dict[str, float]:
+    autoscroll = common.headless()
+    autoscroll.update(debug=TRACE if trace else None)
+    result = []
+    for _, x, y, button, pressed in common.clicks(clicks):
+        start = perf_counter_ns()
+        autoscroll._on_click(x, y, button, pressed)
+        result.append(perf_counter_ns() - start)
+    result.sort()
+    return {'median': median(result) / 1e3,
+            'p99': result[int(len(result) * 0.99)] / 1e3}
+
+
+def interval(events: int = EVENTS) -> float:
+    # nanoseconds per motion update, the interval is recalculated on each
+    motion = common.headless().scrolling.motion
+    motion.start(*common.START)
+    events = [event[1:] for event in common.motion(events)]
+    start = perf_counter()
+    for x, y in events:
+        motion.move(x, y)
+    return (perf_counter() - start) / len(events) * 1e9
+
+
+def scroll_for(scrolling: Dict[str, Any], x: int, y: int,
+               duration: float = DURATION) -> Autoscroll:
+    # the scroll loop running for duration with the pointer at x, y from
+    # the starting point
+    autoscroll = common.headless()
+    autoscroll.update(scrolling={'acceleration': ACCELERATION, **scrolling})
+    autoscroll._on_click(*common.START, autoscroll.buttons.start, True)
+    autoscroll._on_move(common.START[0] + x, common.START[1] + y)
+    autoscroll.scrolling.scheduler.reset()
+    common.sink(autoscroll).clear()
+    autoscroll.thread_loop.start()
+    sleep(duration)
+    autoscroll.stop()
+    autoscroll.thread_loop.join()
+    return autoscroll
+
+
+def ticks(tick_rate: int = 0, duration: float = DURATION) -> Dict[str, float]:
+    autoscroll = scroll_for({'tick_rate': tick_rate}, 0, DISTANCE, duration)
+    scrolling, sink = autoscroll.scrolling, common.sink(autoscroll)
+    # one unit per interval, whatever the tick rate
+    target = duration / scrolling.sleep_interval
+    scrolled = abs(sink.total()[1])
+    scheduler = scrolling.scheduler
+    return {'target': target, 'scrolled': scrolled,
+            'error': (scrolled - target) / target,
+            'late_average':
+                scheduler.late_total / (scheduler.ticks or 1) / 1e3,
+            'late_max': scheduler.late_max / 1e3,
+            'missed': scheduler.missed, 'dropped': scheduler.dropped}
+
+
+def diagonal(independent: bool,
+             duration: float = DURATION) -> Dict[str, float]:
+    # the pointer 3 times farther away vertically than horizontally
+    autoscroll = scroll_for({'independent': independent}, DISTANCE // 3,
+                            DISTANCE, duration)
+    sink = common.sink(autoscroll)
+    units_x, units_y = sink.total()
+    return {'events': len(sink.events), 'x': abs(units_x), 'y': abs(units_y)}
+
+
+def linear(speed: int = SCROLLING_SPEED,
+           acceleration: int = ACCELERATION) -> Dict[str, float]:
+    differ, capped = 0, None
+    for distance, interval in enumerate(build_table('linear', speed,
+                                                    acceleration)):
+        value = acceleration * distance + speed
+        previous = abs(100 / value) if value \
+            else SCROLLING_SLEEP_INTERVAL_INITIAL
+        if previous >= SCROLLING_INTERVAL_MINIMUM:
+            differ += interval != previous
+        elif capped is None:
+            capped = distance
+    return {'differ': differ, 'capped': capped}
+
+
+def run() -> Dict[str, float]:
+    result = {'on_move': on_move(), 'on_move_lazy': on_move(lazy=True),
+              'on_move_traced': on_move(trace=True),
+              'interval_ns': interval()}
+    for name, value in on_click().items():
+        result[f'on_click_{name}_us'] = value
+    for name, value in on_click(trace=True).items():
+        result[f'on_click_traced_{name}_us'] = value
+    for tick_rate in (0, 250):
+        for name, value in ticks(tick_rate).items():
+            result[f'ticks_{tick_rate}_{name}'] = value
+    for independent in (False, True):
+        for name, value in diagonal(independent).items():
+            result[f'diagonal_{"independent" if independent else "together"}'
+                   f'_{name}'] = value
+    for name, value in linear().items():
+        result[f'linear_{name}'] = value
+    return result
+
+
+def main() -> None:
+    result = run()
+    print(f'on_move:          {result["on_move"]:12.0f} events/s')
+    print(f'on_move (lazy):   {result["on_move_lazy"]:12.0f} events/s')
+    print(f'on_move (traced): {result["on_move_traced"]:12.0f} events/s')
+    print(f'interval:         {result["interval_ns"]:12.0f} ns/event')
+    for name in ('', 'traced_'):
+        label = 'on_click (traced):' if name else 'on_click:'
+        print(f'{label:18} median '
+              f'{result[f"on_click_{name}median_us"]:.1f}us, '
+              f'p99 {result[f"on_click_{name}p99_us"]:.1f}us')
+    for tick_rate in (0, 250):
+        name = f'ticks_{tick_rate}'
+        print(f'ticks (rate {tick_rate:3}): '
+              f'{result[f"{name}_scrolled"]:7.1f} of '
+              f'{result[f"{name}_target"]:7.1f} units '
+              f'({result[f"{name}_error"] * 100:+.1f}%), late average '
+              f'{result[f"{name}_late_average"]:.0f}us, max '
+              f'{result[f"{name}_late_max"]:.0f}us')
+    for name in ('together', 'independent'):
+        print(f'diagonal ({name}): '
+              f'{result[f"diagonal_{name}_events"]:5} events, '
+              f'{result[f"diagonal_{name}_x"]:5.0f} units x, '
+              f'{result[f"diagonal_{name}_y"]:5.0f} units y')
+    print(f'linear: {result["linear_differ"]} distances differ from the '
+          f'previous formula above the cap, capped from '
+          f'{result["linear_capped"]}px')
+
+
+if __name__ == '__main__':
+    main()
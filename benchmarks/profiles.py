@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# per-application profiles, without a display, the tracked window is a
+# stand-in with a fixed class:
+# - _on_click latency, a start and an end click, without profiles, with
+#   PROFILES profiles and the window matching one of them, and with the
+#   profile applied by updating the scrolling options on every start
+# - how long changing the speed takes with PROFILES profiles, only the
+#   curves that depend on it are rebuilt
+# - whether switching between a profile with independent axes and one
+#   without changes how the scroll events are split between the axes
+#
+# looking the window up when the scrolling starts would add at least two
+# round trips to the x server (the window under the pointer and its class)
+# on top of these, the tracked window never waits for it
+#
+# python3 -m benchmarks.profiles
+
+from statistics import median
+from time import perf_counter_ns
+from typing import Dict, List, Tuple
+
+from pynput.mouse import Button
+
+from autoscroll.autoscroll import Autoscroll
+
+from . import common
+
+CLICKS: int = 2_000
+UPDATES: int = 50
+PROFILES: int = 20
+CLASSES: Tuple[str, ...] = ('xterm', 'xterm')
+# the pointer this far from the starting point, 1 unit along x for every
+# 2 along y with independent axes
+OFFSET: Tuple[int, int] = (50, 100)
+TICKS: int = 10
+
+
+class Windows:
+    # stands in for windows.Windows, the pointer is always over an xterm
+    classes: Tuple[str, ...] = CLASSES
+
+
+def headless(profiles: int = PROFILES) -> Autoscroll:
+    windows = [[f'application{i}', f'speed={100 + i}', 'dead-area=20',
+                'function=quadratic'] for i in range(profiles - 1)]
+    windows.append([CLASSES[0], 'speed=100', 'dead-area=20',
+                    'function=quadratic'])
+    autoscroll = common.headless()
+    autoscroll.profiles.windows = Windows()
+    autoscroll.update(profiles={'enable': True, 'window': windows})
+    return autoscroll
+
+
+def percentiles(result: List[int]) -> Dict[str, float]:
+    result.sort()
+    return {'median': median(result) / 1e3,
+            'p99': result[int(len(result) * 0.99)] / 1e3}
+
+
+def on_click(profiles: int, on_start: bool = False,
+             clicks: int = CLICKS) -> Dict[str, float]:
+    autoscroll = headless(profiles) if profiles else common.headless()
+    result = []
+    for _, x, y, button, pressed in common.clicks(clicks):
+        start = perf_counter_ns()
+        if on_start and not autoscroll.scrolling.is_scrolling():
+            # what the profile costs if it is applied as options
+            autoscroll.scrolling.update(speed=100, dead_area=20,
+                                        function='quadratic')
+        autoscroll._on_click(x, y, button, pressed)
+        result.append(perf_counter_ns() - start)
+    return percentiles(result)
+
+
+def update(profiles: int = PROFILES, updates: int = UPDATES) -> float:
+    autoscroll = headless(profiles)
+    result = []
+    for i in range(updates):
+        start = perf_counter_ns()
+        autoscroll.update(scrolling={'speed': 1000 + i})
+        result.append(perf_counter_ns() - start)
+    return median(result) / 1e6
+
+
+def independent(ticks: int = TICKS) -> bool:
+    autoscroll = common.headless()
+    windows = autoscroll.profiles.windows = Windows()
+    autoscroll.update(profiles={'enable': True, 'window': [
+        ['xterm', 'independent'], ['emacs', 'independent=false']]})
+    scrolling, sink = autoscroll.scrolling, common.sink(autoscroll)
+    x, y = common.START
+    totals = {}
+    for name in ('xterm', 'emacs', 'xterm'):
+        windows.classes = (name, name)
+        sink.clear()
+        autoscroll._on_click(x, y, Button.middle, True)
+        autoscroll._on_move(x + OFFSET[0], y + OFFSET[1])
+        scrolling.ticks, scrolling.tick = ticks, scrolling.sleep_interval
+        scrolling.scroll_once()
+        autoscroll._on_click(x, y, Button.middle, True)
+        totals[name] = sink.total()
+    return (totals['xterm'] == (-ticks * OFFSET[0] // OFFSET[1], -ticks)
+            and totals['emacs'] == (-ticks, -ticks))
+
+
+def run() -> Dict[str, float]:
+    result = {}
+    for name, profiles, on_start in (('none', 0, False),
+                                     ('tracked', PROFILES, False),
+                                     ('updated', 0, True)):
+        for key, value in on_click(profiles, on_start).items():
+            result[f'on_click_{name}_{key}_us'] = value
+    result['update_ms'] = update()
+    result['independent'] = independent()
+    return result
+
+
+def main() -> None:
+    result = run()
+    for name, label in (('none', 'no profiles'),
+                        ('tracked', f'{PROFILES} profiles'),
+                        ('updated', 'options updated on start')):
+        print(f'on_click, {label + ":":25} '
+              f'median {result[f"on_click_{name}_median_us"]:7.1f}us, '
+              f'p99 {result[f"on_click_{name}_p99_us"]:7.1f}us')
+    print(f'update, {PROFILES} profiles: {result["update_ms"]:.1f}ms')
+    print(f'independent axes follow the profile: {result["independent"]}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# input recording and replaying:
+# - cpu time per motion event while scrolling, replayed as fast as
+#   possible, without and with recording
+# - records read from a recording per second
+# - a scrolling session recorded in real time, then replayed from the
+#   recording, the scroll events of both
+# - whether events passed on the way pynput does, with whether they were
+#   injected as the last argument, are recorded
+# - whether every motion event is recorded exactly once, in order, while
+#   another thread keeps flushing
+#
+# python3 -m benchmarks.recorder
+
+from os.path import join as path_join
+from sys import getswitchinterval, setswitchinterval
+from tempfile import TemporaryDirectory
+from threading import Event, Thread
+from time import perf_counter, process_time
+from typing import Dict
+
+from pynput.mouse import Button
+
+from autoscroll.autoscroll.recorder import Recorder, read
+from autoscroll.autoscroll.replay import replay
+
+from . import common
+
+EVENTS: int = 1_000_000
+# seconds of the recorded session
+DURATION: float = 1
+# the pointer this far below the starting point
+DISTANCE: int = 100
+# motion events recorded while another thread flushes
+FLUSHED: int = 100_000
+
+
+def per_event(path: str = None, events: int = EVENTS) -> float:
+    # cpu nanoseconds per motion event, the listener thread included
+    autoscroll = common.headless(common.motion(events))
+    autoscroll.listener.attach()
+    if path is not None:
+        autoscroll.update(debug={'record': path})
+    start = process_time()
+    autoscroll.thread_scroll_listener.start()
+    autoscroll.thread_scroll_listener.join()
+    result = (process_time() - start) * 1e9 / events
+    autoscroll.debug.recorder.close()
+    return result
+
+
+def read_rate(path: str) -> float:
+    start, count = perf_counter(), 0
+    for _ in read(path):
+        count += 1
+    return count / (perf_counter() - start)
+
+
+def session(path: str, duration: float = DURATION) -> Dict[str, float]:
+    events = [(0, *common.START, 2, True)]
+    events.extend((time, x, y + DISTANCE) for time, x, y in
+                  common.motion(int(duration * common.MOTION_RATE)))
+    events.append((int(duration * 1e9), *common.START, 2, True))
+    autoscroll = common.headless(events, speed=1)
+    autoscroll.update(debug={'record': path})
+    autoscroll.thread_loop.start()
+    autoscroll.thread_scroll_listener.start()
+    autoscroll.thread_scroll_listener.join()
+    autoscroll.stop()
+    autoscroll.thread_loop.join()
+    recorded = common.sink(autoscroll)
+    replayed = replay(path)
+    return {'recorded_events': len(recorded.events),
+            'recorded_y': recorded.total()[1],
+            'replayed_events': len(replayed),
+            'replayed_y': sum(event[2] for event in replayed)}
+
+
+def pynput_events(path: str) -> bool:
+    # pynput calls on_move(x, y, injected) and
+    # on_click(x, y, button, pressed, injected)
+    autoscroll = common.headless()
+    autoscroll.update(debug={'record': path})
+    source = autoscroll.listener.source
+    source.on_click(*common.START, Button.middle, True, False)
+    source.on_move(common.START[0], common.START[1] + DISTANCE, False)
+    source.on_click(*common.START, Button.middle, True, False)
+    autoscroll.debug.recorder.close()
+    return [event[1:] for event in read(path)] == [
+        (*common.START, Button.middle, True),
+        (common.START[0], common.START[1] + DISTANCE),
+        (*common.START, Button.middle, True)]
+
+
+def concurrent_flush(path: str, events: int = FLUSHED) -> bool:
+    # threads switched as often as possible, a flush can land anywhere
+    interval = getswitchinterval()
+    setswitchinterval(1e-6)
+    recorder, done = Recorder(), Event()
+    recorder.open(path)
+
+    def flush() -> None:
+        while not done.is_set():
+            recorder.flush()
+    thread = Thread(target=flush)
+    thread.start()
+    for i in range(events):
+        recorder.on_move(i, 0)
+    done.set()
+    thread.join()
+    recorder.close()
+    setswitchinterval(interval)
+    return [event[1] for event in read(path)] == list(range(events))
+
+
+def run() -> Dict[str, float]:
+    with TemporaryDirectory() as directory:
+        path = path_join(directory, 'input.bin')
+        result = {'per_event_off': per_event(),
+                  'per_event_on': per_event(path)}
+        result['read_per_second'] = read_rate(path)
+        result.update(session(path_join(directory, 'session.bin')))
+        result['pynput_events'] = pynput_events(
+            path_join(directory, 'pynput.bin'))
+        result['concurrent_flush'] = concurrent_flush(
+            path_join(directory, 'flushed.bin'))
+    return result
+
+
+def main() -> None:
+    result = run()
+    off, on = result['per_event_off'], result['per_event_on']
+    print(f'per event, not recording: {off:6.0f} ns')
+    print(f'per event, recording:     {on:6.0f} ns (+{on - off:.0f} ns)')
+    print(f'read:     {result["read_per_second"]:10.0f} records/s')
+    for name in ('recorded', 'replayed'):
+        print(f'{name + ":":9} {result[f"{name}_events"]:4.0f} scroll events, '
+              f'{result[f"{name}_y"]:4.0f} units')
+    print(f'pynput-shaped events recorded: {result["pynput_events"]}')
+    print(f'recorded once each while flushed: {result["concurrent_flush"]}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# threads, context switches and cpu usage of everything but the listener,
+# with the config file, the metrics and the control socket enabled:
+# - while scrolling, 1000 Hz motion replayed in real time
+# - while idle
+# and how long stop takes to shut everything down
+#
+# python3 -m benchmarks.runtime
+
+from os import listdir
+from os.path import join as path_join
+from tempfile import TemporaryDirectory
+from threading import active_count
+from time import perf_counter, process_time, sleep
+from typing import Dict
+
+from autoscroll.autoscroll import Autoscroll
+
+from . import common
+
+# seconds
+DURATION: float = 3
+# the pointer this far below the starting point
+DISTANCE: int = 100
+
+
+def switches() -> int:
+    # context switches of every thread alive, linux only
+    total = 0
+    for task in listdir('/proc/self/task'):
+        try:
+            with open(f'/proc/self/task/{task}/status') as status:
+                total += sum(int(line.split()[1]) for line in status
+                             if 'ctxt_switches' in line)
+        except OSError:
+            # ended in the meantime
+            pass
+    return total
+
+
+def headless(directory: str, duration: float = DURATION) -> Autoscroll:
+    config = path_join(directory, 'config.txt')
+    with open(config, 'w') as config_file:
+        config_file.write('--scrolling-speed 300\n')
+    # a click, motion around a point below the starting point, a click
+    events = [(0, *common.START, 2, True)]
+    events.extend((time, x, y + DISTANCE) for time, x, y in
+                  common.motion(int(duration * common.MOTION_RATE)))
+    events.append((int(duration * 1e9), *common.START, 2, True))
+    autoscroll = common.headless(events, speed=1)
+    autoscroll.update(config={'enable': True, 'path': config},
+                      metrics={'enable': True, 'interval': 1,
+                               'path': path_join(directory, 'metrics.prom')},
+                      remote={'enable': True,
+                              'path': path_join(directory, 'control.sock')})
+    return autoscroll
+
+
+def run() -> Dict[str, float]:
+    with TemporaryDirectory() as directory:
+        autoscroll = headless(directory)
+        autoscroll.thread_loop.start()
+        sleep(0.5)
+        result = {'threads': active_count()}
+        switched, start = switches(), process_time()
+        autoscroll.thread_scroll_listener.start()
+        autoscroll.thread_scroll_listener.join()
+        # the listener has ended, its switches are not counted
+        result['scrolling_switches'] = (switches() - switched) / DURATION
+        result['scrolling_cpu'] = (process_time() - start) / DURATION * 100
+        result['scrolls'] = len(common.sink(autoscroll).events)
+        switched, start = switches(), process_time()
+        sleep(DURATION)
+        result['idle_switches'] = (switches() - switched) / DURATION
+        result['idle_cpu'] = (process_time() - start) / DURATION * 100
+        start = perf_counter()
+        autoscroll.stop()
+        autoscroll.thread_loop.join()
+        result['stop_ms'] = (perf_counter() - start) * 1e3
+    return result
+
+
+def main() -> None:
+    result = run()
+    print(f'threads:   {result["threads"]}, the listener not included')
+    for name in ('scrolling', 'idle'):
+        print(f'{name + ":":10} {result[f"{name}_switches"]:6.1f} context '
+              f'switches/s, {result[f"{name}_cpu"]:4.1f}% cpu')
+    print(f'stop:      {result["stop_ms"]:6.1f}ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# time from SIGTERM or SIGINT to exit while the qt application of the icon
+# is idle, the signal handlers must run even though no qt event arrives
+#
+# python3 -m benchmarks.shutdown
+
+from os import environ as os_environ
+from signal import SIGINT, SIGTERM, Signals
+from statistics import median
+from subprocess import PIPE, Popen, TimeoutExpired
+from sys import executable as sys_executable
+from time import perf_counter, sleep
+from typing import Dict
+
+RUNS: int = 5
+# after the icon is created, so exec() is waiting for events
+IDLE: float = 0.3
+# counted as not stopping at all
+TIMEOUT: float = 5.0
+
+SCRIPT: str = '''
+from threading import Thread
+from benchmarks.common import headless
+autoscroll = headless(icon={'enable': True})
+def ready():
+    autoscroll.icon.event_qt_application_started.wait()
+    print('ready', flush=True)
+Thread(target=ready, daemon=True).start()
+autoscroll.start()
+'''
+
+
+def measure(signal_number: Signals, runs: int = RUNS) -> float:
+    # median seconds, TIMEOUT if any run did not stop
+    environment = {'PYNPUT_BACKEND': 'dummy', 'QT_QPA_PLATFORM': 'offscreen',
+                   **os_environ}
+    durations = []
+    for _ in range(runs):
+        process = Popen((sys_executable, '-c', SCRIPT), env=environment,
+                        stdout=PIPE, stderr=PIPE, text=True)
+        try:
+            if process.stdout.readline().strip() != 'ready':
+                raise RuntimeError(process.communicate()[1].strip()
+                                   or 'the icon did not start')
+            sleep(IDLE)
+            start = perf_counter()
+            process.send_signal(signal_number)
+            try:
+                process.wait(TIMEOUT)
+            except TimeoutExpired:
+                durations.append(TIMEOUT)
+                continue
+            durations.append(perf_counter() - start)
+        finally:
+            process.kill()
+            process.communicate()
+    return median(durations)
+
+
+def run() -> Dict[str, float]:
+    try:
+        import PySide6  # noqa: F401
+    except ImportError:
+        return {}
+    return {f'{signal_number.name.lower()}_ms': measure(signal_number) * 1e3
+            for signal_number in (SIGTERM, SIGINT)}
+
+
+def main() -> None:
+    result = run()
+    if not result:
+        print('pyside6 is not installed, there is no icon to measure')
+    for name, value in result.items():
+        if value >= TIMEOUT * 1e3:
+            print(f'{name[:-3] + ":":8} did not stop in {TIMEOUT:.0f}s')
+            continue
+        print(f'{name[:-3] + ":":8} exited after {value:7.1f}ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# time from interpreter start to a state where the first scroll could
+# happen: everything imported, argv parsed, objects constructed
+# plus the heaviest imports, as reported by 'python -X importtime'
+#
+# python3 -m benchmarks.startup
+
+from os import environ as os_environ
+from statistics import median
+from subprocess import run as subprocess_run
+from sys import executable as sys_executable
+from time import perf_counter
+from typing import Dict, List
+
+RUNS: int = 10
+TOP: int = 8
+
+# headless, the listener is not constructed
+SCRIPT: str = '''
+from os import environ
+environ.setdefault('PYNPUT_BACKEND', 'dummy')
+from autoscroll.autoscroll.support import Buttons, Config, Debug, Icon, Scrolling
+config = Config()
+Scrolling(), Icon(), Buttons(), Debug()
+config.parse_argv()
+'''
+
+
+def time_to_ready(runs: int = RUNS) -> float:
+    environment = {**os_environ, 'PYNPUT_BACKEND': 'dummy'}
+    result = []
+    for _ in range(runs):
+        start = perf_counter()
+        subprocess_run((sys_executable, '-c', SCRIPT), check=True,
+                       env=environment)
+        result.append(perf_counter() - start)
+    return median(result)
+
+
+def time_baseline(runs: int = RUNS) -> float:
+    result = []
+    for _ in range(runs):
+        start = perf_counter()
+        subprocess_run((sys_executable, '-c', 'pass'), check=True)
+        result.append(perf_counter() - start)
+    return median(result)
+
+
+def import_times() -> List[Dict[str, int]]:
+    environment = {**os_environ, 'PYNPUT_BACKEND': 'dummy'}
+    process = subprocess_run(
+        (sys_executable, '-X', 'importtime', '-c', SCRIPT),
+        check=True, env=environment, capture_output=True, text=True)
+    result = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        own, cumulative, name = line[len('import time:'):].split('|')
+        name = name.strip()
+        if name not in result or result[name]['cumulative'] < int(cumulative):
+            result[name] = {'name': name, 'own': int(own),
+                            'cumulative': int(cumulative)}
+    return list(result.values())
+
+
+def run() -> Dict[str, float]:
+    result = {'interpreter_ms': time_baseline() * 1e3,
+              'ready_ms': time_to_ready() * 1e3}
+    for item in sorted(import_times(), key=lambda item: item['cumulative'],
+                       reverse=True)[:TOP]:
+        result[f'import_{item["name"]}_ms'] = item['cumulative'] / 1e3
+    return result
+
+
+def main() -> None:
+    result = run()
+    baseline, ready = result['interpreter_ms'], result['ready_ms']
+    print(f'interpreter:        {baseline:7.1f}ms')
+    print(f'first scroll ready: {ready:7.1f}ms (+{ready - baseline:.1f}ms)')
+    print('heaviest imports, cumulative:')
+    for name, value in result.items():
+        if name.startswith('import_'):
+            print(f'  {value:7.1f}ms {name[len("import_"):-len("_ms")]}')
+
+
+if __name__ == '__main__':
+    main()
@@ -24,11 +24,11 @@ setup(
     classifiers=[
         'License :: OSI Approved :: GNU General Public License v3 (GPLv3)',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3.9',
         'Operating System :: OS Independent'],
     packages=find_packages(where='.'),
     include_package_data=True,
     install_requires=['pynput'],
     extras_require={'icon': ['pyside6']},
     entry_points={'console_scripts': ['autoscroll = autoscroll.main:start']},
-    python_requires='>=3.6')
+    python_requires='>=3.9')